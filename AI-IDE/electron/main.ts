@@ -117,6 +117,33 @@ ipcMain.handle('check-deps', async (_event, filePath) => {
     pythonProcess.stdout.on('data', (d) => result += d.toString());
     pythonProcess.stderr.on('data', (d) => console.error(`DepCheck Error: ${d}`));
 
+    pythonProcess.on('close', (_code) => {
+      try {
+        const json = JSON.parse(result)
+        if (json.missing?.length) {
+          // Installs go through the local wheelhouse so repeat and offline installs skip the index
+          const wheelhouse = path.join(process.env.APP_ROOT, 'py', 'wheelhouse.py')
+          json.installCommand = `python "${wheelhouse}" install ${json.missing.join(' ')}`
+        }
+        resolve(json)
+      }
+      catch (e) { resolve({ error: 'Failed to parse dep check output', raw: result }) }
+    })
+  })
+})
+
+ipcMain.handle('check-project-deps', async (_event, dirPath) => {
+  return new Promise((resolve) => {
+    const pythonProcess = spawn('python', [
+      path.join(process.env.APP_ROOT, 'py', 'dep_checker.py'),
+      '--project',
+      dirPath
+    ]);
+
+    let result = '';
+    pythonProcess.stdout.on('data', (d) => result += d.toString());
+    pythonProcess.stderr.on('data', (d) => console.error(`DepCheck Error: ${d}`));
+
     pythonProcess.on('close', (_code) => {
       try { resolve(JSON.parse(result)) }
       catch (e) { resolve({ error: 'Failed to parse dep check output', raw: result }) }
@@ -161,6 +188,94 @@ ipcMain.on('terminal-input', (_event, data) => {
   s.stdin.write(data)
 })
 
+// Persistent Kernel
+let kernel: ChildProcessWithoutNullStreams | null = null
+let kernelPending = new Map<number, (event: any) => void>()
+let kernelRequestId = 0
+
+// Events normally arrive one per line, but stray raw output must not hide an event behind it
+function parseKernelLine(line: string): any[] {
+  if (!line.trim()) return []
+  try { return [JSON.parse(line)] } catch (e) { /* Raw output before an event */ }
+  const start = line.indexOf('{"id"')
+  if (start !== -1) {
+    try {
+      const event = JSON.parse(line.slice(start))
+      return [{ id: event.id, event: 'stream', name: 'stdout', text: line.slice(0, start) }, event]
+    } catch (e) { /* Not an event after all */ }
+  }
+  return [{ id: null, event: 'stream', name: 'stdout', text: line + '\n' }]
+}
+
+function ensureKernel() {
+  if (kernel) return kernel
+
+  const proc = spawn('python', ['-u', path.join(process.env.APP_ROOT, 'py', 'kernel.py')], {
+    cwd: process.env.USERPROFILE || process.cwd(),
+    env: process.env
+  })
+  // Each kernel process answers only the requests sent to it
+  const pending = new Map<number, (event: any) => void>()
+  kernelPending = pending
+
+  let buffer = ''
+  proc.stdout.on('data', (data) => {
+    buffer += data.toString()
+    let newline
+    while ((newline = buffer.indexOf('\n')) !== -1) {
+      const line = buffer.slice(0, newline)
+      buffer = buffer.slice(newline + 1)
+      for (const event of parseKernelLine(line)) {
+        win?.webContents.send('kernel-event', event)
+        if ((event.event === 'done' || event.event === 'variables') && pending.has(event.id)) {
+          pending.get(event.id)!(event)
+          pending.delete(event.id)
+        }
+      }
+    }
+  })
+
+  proc.stderr.on('data', (d) => console.error(`Kernel Error: ${d}`))
+
+  proc.on('exit', (code) => {
+    for (const [id, resolve] of pending) resolve({ id, event: 'done', status: 'dead', exitCode: code })
+    pending.clear()
+    if (kernel === proc) {
+      kernel = null
+      win?.webContents.send('kernel-event', { event: 'exit', exitCode: code })
+    }
+  })
+
+  kernel = proc
+  return proc
+}
+
+function kernelRequest(request: object): Promise<any> {
+  const proc = ensureKernel()
+  const id = ++kernelRequestId
+  return new Promise((resolve) => {
+    kernelPending.set(id, resolve)
+    proc.stdin.write(JSON.stringify({ id, ...request }) + '\n')
+  })
+}
+
+ipcMain.handle('kernel-execute', async (_event, code) => kernelRequest({ command: 'execute', code }))
+
+ipcMain.handle('kernel-variables', async (_event, deep) => kernelRequest({ command: 'variables', deep: !!deep }))
+
+ipcMain.on('kernel-interrupt', () => {
+  kernel?.stdin.write(JSON.stringify({ command: 'interrupt' }) + '\n')
+})
+
+ipcMain.handle('kernel-restart', async () => {
+  if (kernel) {
+    kernel.kill()
+    kernel = null
+  }
+  ensureKernel()
+  return { success: true }
+})
+
 // ... (terminal logic)
 
 
@@ -211,9 +326,77 @@ ipcMain.handle('analyze-dataset', async (_event, filePath) => {
   })
 })
 
+ipcMain.handle('generate-loader', async (_event, filePath) => {
+  return new Promise((resolve) => {
+    const pythonProcess = spawn('python', [
+      path.join(process.env.APP_ROOT, 'py', 'loader_generator.py'),
+      filePath
+    ]);
+
+    let result = '';
+    pythonProcess.stdout.on('data', (d) => result += d.toString());
+    pythonProcess.stderr.on('data', (d) => console.error(`Loader Generator Error: ${d}`));
+
+    pythonProcess.on('close', (_code) => {
+      try { resolve(JSON.parse(result)) }
+      catch (e) { resolve({ error: 'Failed to parse loader generator output', raw: result }) }
+    })
+  })
+})
+
+// Row server: one long-lived process keeps dataset indexes memory-mapped between page requests
+let rowServer: ChildProcessWithoutNullStreams | null = null
+let rowServerPending: ((result: any) => void)[] = []
+
+function ensureRowServer() {
+  if (rowServer) return rowServer
+
+  const proc = spawn('python', ['-u', path.join(process.env.APP_ROOT, 'py', 'row_server.py'), 'serve'])
+  // Requests are answered one line each, in the order they were sent
+  const pending: ((result: any) => void)[] = []
+  rowServerPending = pending
+
+  let buffer = ''
+  proc.stdout.on('data', (data) => {
+    buffer += data.toString()
+    let newline
+    while ((newline = buffer.indexOf('\n')) !== -1) {
+      const line = buffer.slice(0, newline)
+      buffer = buffer.slice(newline + 1)
+      const resolve = pending.shift()
+      if (!resolve) continue
+      try { resolve(JSON.parse(line)) }
+      catch (e) { resolve({ error: 'Failed to parse row server output', raw: line }) }
+    }
+  })
+
+  proc.stderr.on('data', (d) => console.error(`Row Server Error: ${d}`))
+
+  proc.on('exit', (code) => {
+    for (const resolve of pending.splice(0)) resolve({ error: `Row server exited (${code})` })
+    if (rowServer === proc) rowServer = null
+  })
+
+  rowServer = proc
+  return proc
+}
+
+ipcMain.handle('dataset-query', async (_event, command, ...args) => {
+  const proc = ensureRowServer()
+  return new Promise((resolve) => {
+    rowServerPending.push(resolve)
+    proc.stdin.write(JSON.stringify({
+      command,
+      args: args.map((a: unknown) => (a === undefined || a === null) ? '' : String(a))
+    }) + '\n')
+  })
+})
+
 // ... (cleanup)
 app.on('will-quit', () => {
   if (shell) shell.kill()
+  if (kernel) kernel.kill()
+  if (rowServer) rowServer.kill()
 })
 
 app.on('window-all-closed', () => {
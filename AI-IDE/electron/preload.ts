@@ -43,6 +43,18 @@ contextBridge.exposeInMainWorld('terminal', {
   }
 })
 
+contextBridge.exposeInMainWorld('kernel', {
+  execute: (code: string) => ipcRenderer.invoke('kernel-execute', code),
+  variables: (deep = false) => ipcRenderer.invoke('kernel-variables', deep),
+  interrupt: () => ipcRenderer.send('kernel-interrupt'),
+  restart: () => ipcRenderer.invoke('kernel-restart'),
+  onEvent: (callback: (event: any) => void) => {
+    const subscription = (_event: any, data: any) => callback(data)
+    ipcRenderer.on('kernel-event', subscription)
+    return () => ipcRenderer.off('kernel-event', subscription)
+  }
+})
+
 contextBridge.exposeInMainWorld('appControl', {
   setMode: (mode: string) => ipcRenderer.send('set-mode', mode)
 })
@@ -52,7 +64,17 @@ contextBridge.exposeInMainWorld('kaggle', {
   download: (id: string, path: string) => ipcRenderer.invoke('kaggle-action', 'download', id, path)
 })
 
+contextBridge.exposeInMainWorld('datasets', {
+  index: (path: string) => ipcRenderer.invoke('dataset-query', 'index', path),
+  rows: (path: string, start: number, count: number, columns?: string[]) =>
+    ipcRenderer.invoke('dataset-query', 'rows', path, start, count, columns?.join(',') ?? ''),
+  scan: (path: string, column: string, op: string, value: string, startRow = 0, limit = 100) =>
+    ipcRenderer.invoke('dataset-query', 'scan', path, column, op, value, startRow, limit)
+})
+
 contextBridge.exposeInMainWorld('analysis', {
   recommend: (path: string) => ipcRenderer.invoke('analyze-dataset', path),
-  checkDeps: (path: string) => ipcRenderer.invoke('check-deps', path)
+  generateLoader: (path: string) => ipcRenderer.invoke('generate-loader', path),
+  checkDeps: (path: string) => ipcRenderer.invoke('check-deps', path),
+  checkProjectDeps: (dirPath: string) => ipcRenderer.invoke('check-project-deps', dirPath)
 })
@@ -2,11 +2,23 @@
 Dependency Checker for AI IDE.
 Parses Python code for imports and checks if they're installed.
 Returns a list of packages to install.
+
+Usage:
+    dep_checker.py <file>                 (missing packages of one script)
+    dep_checker.py --project <directory>  (import graph of a whole project)
+
+Project mode parses every .py file under the directory (in parallel when
+many changed), caches each file's imports by content hash so re-runs only
+re-parse edited files, and classifies every imported module as local,
+stdlib, installed or missing.
 """
 import sys
+import os
 import json
 import ast
+import hashlib
 import importlib.util
+from concurrent.futures import ProcessPoolExecutor
 
 # Mapping of import names to pip package names
 IMPORT_TO_PACKAGE = {
@@ -17,6 +29,20 @@ IMPORT_TO_PACKAGE = {
     "bs4": "beautifulsoup4",
 }
 
+STDLIB = set(getattr(sys, "stdlib_module_names", ())) | {
+    'os', 'sys', 'json', 'math', 'random', 'datetime', 'time', 're', 'collections',
+    'itertools', 'functools', 'typing', 'pathlib', 'subprocess', 'threading', 'multiprocessing',
+    'io', 'string', 'copy', 'pickle', 'csv', 'xml', 'html', 'http', 'urllib', 'socket',
+    'asyncio', 'logging', 'unittest', 'argparse', 'shutil', 'glob', 'tempfile', 'zipfile',
+    'hashlib', 'base64', 'struct', 'array', 'queue', 'enum', 'dataclasses', 'abc', 'contextlib',
+    'warnings', 'traceback', 'inspect', 'dis', 'ast', 'platform', 'ctypes', 'signal', 'gc'}
+
+SKIP_DIRS = {"venv", ".venv", "env", "node_modules", "__pycache__", ".git", "site-packages", "dist", "build"}
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".ai_ide", "dep_cache")
+CACHE_VERSION = 1
+PARALLEL_THRESHOLD = 32  # Below this many changed files, process start-up costs more than it saves
+
+
 def get_imports(code: str) -> set:
     """Extract all import names from Python code."""
     imports = set()
@@ -27,7 +53,7 @@ def get_imports(code: str) -> set:
                 for alias in node.names:
                     imports.add(alias.name.split('.')[0])
             elif isinstance(node, ast.ImportFrom):
-                if node.module:
+                if node.module and not node.level:
                     imports.add(node.module.split('.')[0])
     except SyntaxError:
         pass  # Ignore syntax errors in code
@@ -42,36 +68,207 @@ def get_pip_name(import_name: str) -> str:
     """Convert import name to pip package name."""
     return IMPORT_TO_PACKAGE.get(import_name, import_name)
 
-def main(code: str):
+def local_modules(directory: str) -> set:
+    """Top-level names importable from a directory: .py files and packages."""
+    names = set()
+    try:
+        for entry in os.scandir(directory):
+            if entry.is_file() and entry.name.endswith(".py"):
+                names.add(entry.name[:-3])
+            elif entry.is_dir() and os.path.exists(os.path.join(entry.path, "__init__.py")):
+                names.add(entry.name)
+    except OSError:
+        pass
+    return names
+
+def main(code: str, file_path: str = None):
     imports = get_imports(code)
     missing = []
-    
-    # Filter out standard library modules
-    stdlib = {'os', 'sys', 'json', 'math', 'random', 'datetime', 'time', 're', 'collections', 
-              'itertools', 'functools', 'typing', 'pathlib', 'subprocess', 'threading', 'multiprocessing',
-              'io', 'string', 'copy', 'pickle', 'csv', 'xml', 'html', 'http', 'urllib', 'socket',
-              'asyncio', 'logging', 'unittest', 'argparse', 'shutil', 'glob', 'tempfile', 'zipfile',
-              'hashlib', 'base64', 'struct', 'array', 'queue', 'enum', 'dataclasses', 'abc', 'contextlib',
-              'warnings', 'traceback', 'inspect', 'dis', 'ast', 'platform', 'ctypes', 'signal', 'gc'}
-    
+    # Sibling modules (e.g. data_model.py next to main.py) are not pip packages
+    local = local_modules(os.path.dirname(os.path.abspath(file_path))) if file_path else set()
+
     for imp in imports:
-        if imp in stdlib:
+        if imp in STDLIB or imp in local:
             continue
         if not check_installed(imp):
             missing.append(get_pip_name(imp))
-    
+
     return {"missing": missing}
 
+
+# --- Project mode ---
+
+def parse_imports(path: str):
+    """
+    Returns ([[module, level, names], ...], error) for one file. `names` are
+    the names of a `from` import, which may themselves be submodules.
+    """
+    try:
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (SyntaxError, ValueError) as e:
+        return [], f"{type(e).__name__}: {e}"
+    except OSError as e:
+        return [], str(e)
+    found = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            found.extend([alias.name, 0, []] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            found.append([node.module or "", node.level, [a.name for a in node.names if a.name != "*"]])
+    return found, None
+
+def _cache_path(root: str) -> str:
+    key = hashlib.sha1(root.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+def _load_cache(root: str) -> dict:
+    try:
+        with open(_cache_path(root), 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get("version") == CACHE_VERSION:
+            return cache["files"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+def _save_cache(root: str, files: dict):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = _cache_path(root) + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"version": CACHE_VERSION, "files": files}, f, separators=(",", ":"))
+    os.replace(tmp_path, _cache_path(root))
+
+def find_python_files(root: str) -> list:
+    files = []
+    for directory, dirs, names in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith('.'))
+        files.extend(os.path.join(directory, n) for n in sorted(names) if n.endswith('.py'))
+    return files
+
+def _resolve_local(root: str, base_dirs: list, parts: list, names=()) -> set:
+    """
+    Project-relative paths of the files an import resolves to, if it is local.
+    `from pkg import mod` prefers pkg/mod.py; otherwise the longest existing
+    prefix of the dotted module path is used.
+    """
+    def find(base, module_parts):
+        stem = os.path.join(base, *module_parts)
+        for candidate in (stem + ".py", os.path.join(stem, "__init__.py")):
+            if os.path.isfile(candidate):
+                return os.path.relpath(candidate, root).replace(os.sep, "/")
+        return None
+
+    for base in base_dirs:
+        targets = {t for t in (find(base, parts + [n]) for n in names) if t}
+        for count in range(len(parts), 0, -1):
+            if names and len(targets) == len(names):
+                break  # Every imported name is a submodule
+            target = find(base, parts[:count])
+            if target:
+                targets.add(target)
+                break
+        if targets:
+            return targets
+    return set()
+
+def _search_dirs(root: str, path: str) -> list:
+    """A script's own directory, then each parent up to the project root."""
+    dirs = []
+    directory = os.path.dirname(path)
+    while True:
+        dirs.append(directory)
+        if directory == root or not directory.startswith(root):
+            return dirs
+        directory = os.path.dirname(directory)
+
+def scan_project(root: str) -> dict:
+    root = os.path.abspath(root)
+    if not os.path.isdir(root):
+        return {"error": f"Not a directory: {root}"}
+
+    cached = _load_cache(root)
+    hashes = {}
+    for path in find_python_files(root):
+        with open(path, 'rb') as f:
+            hashes[path] = hashlib.sha1(f.read()).hexdigest()
+
+    changed = sorted({h: p for p, h in hashes.items() if h not in cached}.items())
+    if len(changed) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor() as pool:
+            parsed = list(pool.map(parse_imports, [p for _, p in changed], chunksize=8))
+    else:
+        parsed = [parse_imports(p) for _, p in changed]
+    for (content_hash, _), (found, error) in zip(changed, parsed):
+        cached[content_hash] = {"imports": found, "error": error}
+    # Only entries for current file contents are kept
+    files_cache = {h: cached[h] for h in set(hashes.values())}
+    _save_cache(root, files_cache)
+
+    graph, modules, errors = {}, {}, {}
+    for path, content_hash in hashes.items():
+        rel_path = os.path.relpath(path, root).replace(os.sep, "/")
+        entry = files_cache[content_hash]
+        if entry["error"]:
+            errors[rel_path] = entry["error"]
+        edges = set()
+        for module, level, names in entry["imports"]:
+            parts = module.split('.') if module else []
+            if level:
+                base = os.path.dirname(path)
+                for _ in range(level - 1):
+                    base = os.path.dirname(base)
+                edges.update(_resolve_local(root, [base], parts, names))
+                continue
+            targets = _resolve_local(root, _search_dirs(root, path), parts, names)
+            top = parts[0]
+            if targets:
+                edges.update(targets)
+                kind = "local"
+            else:
+                edges.add(top)
+                kind = "stdlib" if top in STDLIB else None
+            info = modules.setdefault(top, {"kind": kind, "importers": set()})
+            info["importers"].add(rel_path)
+            if kind == "local":
+                info["kind"] = "local"
+        graph[rel_path] = sorted(edges)
+
+    for name, info in modules.items():
+        if info["kind"] is None:
+            info["kind"] = "installed" if check_installed(name) else "missing"
+        if info["kind"] == "missing":
+            info["package"] = get_pip_name(name)
+        info["importers"] = sorted(info["importers"])
+
+    return {
+        "success": True,
+        "root": root,
+        "files": len(hashes),
+        "parsed": len(changed),
+        "modules": dict(sorted(modules.items())),
+        "missing": sorted({info["package"] for info in modules.values() if info["kind"] == "missing"}),
+        "graph": dict(sorted(graph.items())),
+        "errors": errors,
+    }
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print(json.dumps({"error": "No file path provided"}))
         sys.exit(1)
-    
+
+    if sys.argv[1] == "--project":
+        try:
+            print(json.dumps(scan_project(sys.argv[2] if len(sys.argv) > 2 else os.getcwd())))
+        except Exception as e:
+            print(json.dumps({"error": str(e)}))
+        sys.exit(0)
+
     file_path = sys.argv[1]
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             code = f.read()
-        result = main(code)
+        result = main(code, file_path)
         print(json.dumps(result))
     except Exception as e:
         print(json.dumps({"error": str(e)}))
@@ -0,0 +1,344 @@
+"""
+Persistent Python Kernel for AI IDE.
+Runs cells (a whole script or a selection) in one long-lived namespace, so
+imports and loaded DataFrames survive between runs. stdout/stderr are
+streamed back while a cell runs, a running cell can be interrupted, and
+live variables (with DataFrame memory use) can be inspected at any time.
+Restarting is done by the IDE killing and respawning this process. Cells have
+no stdin (input() raises EOFError): the kernel's stdin carries its requests.
+Events are written to a private copy of stdout; anything written straight to
+fd 1 (os.system, subprocesses, C extensions) is forwarded as stream events.
+
+Requests, one JSON object per line on stdin:
+    {"id": 1, "command": "execute", "code": "df = pd.read_csv(...)"}
+    {"id": 2, "command": "variables", "deep": false}
+    {"command": "interrupt"}
+
+Events, one JSON object per line on stdout:
+    {"id": 1, "event": "stream", "name": "stdout", "text": "..."}
+    {"id": 1, "event": "result", "repr": "..."}
+    {"id": 1, "event": "error", "ename": "KeyError", "evalue": "...", "traceback": "..."}
+    {"id": 1, "event": "done", "status": "ok" | "error" | "interrupted", "seconds": 0.004}
+    {"id": 2, "event": "variables", "variables": [...], "memory": {...}}
+"""
+import sys
+import os
+import io
+import ast
+import json
+import time
+import queue
+import codecs
+import signal
+import reprlib
+import _thread
+import linecache
+import threading
+import traceback
+import types
+
+MAX_EVENT_TEXT = 64 * 1024
+MAX_RESULT_CHARS = 20000
+STREAM_FLUSH_SECONDS = 0.05
+FD_SYNC = b"\x00kernel-sync\x00"  # Written through fd 1 to know when earlier fd output was forwarded
+
+_preview = reprlib.Repr()
+_preview.maxstring = 60
+_preview.maxother = 60
+
+
+class Kernel:
+    def __init__(self):
+        self.namespace = {"__name__": "__main__", "__builtins__": __builtins__}
+        self.execution_count = 0
+        self.current_id = None
+        self._out = sys.__stdout__
+        self._emit_lock = threading.Lock()
+        self._requests = queue.Queue()
+        self._writers = ()  # The running cell's StreamWriters, flushed periodically by _flush_streams
+        self._request_stream = sys.stdin
+        self._fd_synced = threading.Event()
+
+    # --- Protocol ---
+
+    def emit(self, event: dict):
+        line = json.dumps(event, default=str)
+        with self._emit_lock:
+            self._out.write(line + "\n")
+            self._out.flush()
+
+    def serve(self):
+        self._detach_std_streams()
+        threading.Thread(target=self._read_requests, name="KernelReader", daemon=True).start()
+        threading.Thread(target=self._flush_streams, name="KernelFlusher", daemon=True).start()
+        while True:
+            try:
+                request = self._requests.get()
+            except KeyboardInterrupt:
+                continue  # An interrupt that arrived after its cell finished
+            if request is None:
+                return
+            if request.get("command") == "execute":
+                try:
+                    self.execute(request.get("id"), request.get("code", ""))
+                except KeyboardInterrupt:
+                    # The interrupt landed while the cell was already finishing
+                    sys.stdin, sys.stdout, sys.stderr = sys.__stdin__, sys.__stdout__, sys.__stderr__
+                    if self.current_id is not None:
+                        self.emit({"id": self.current_id, "event": "done", "status": "interrupted",
+                                   "execution_count": self.execution_count, "seconds": None})
+                        self.current_id = None
+            else:
+                self.emit({"id": request.get("id"), "event": "error", "ename": "ValueError",
+                           "evalue": f"Unknown command: {request.get('command')}", "traceback": ""})
+
+    def _detach_std_streams(self):
+        """
+        Moves the protocol off fds 0 and 1. Requests are read from a private
+        copy of stdin and fd 0 points at the null device, so neither cells nor
+        their subprocesses can swallow them. Events go to a private copy of
+        stdout and fd 1 becomes a pipe forwarded as stream events, so raw
+        writes can't corrupt an event line.
+        """
+        self._request_stream = os.fdopen(os.dup(sys.__stdin__.fileno()), "r", encoding="utf-8")
+        null = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(null, sys.__stdin__.fileno())
+        os.close(null)
+
+        sys.__stdout__.flush()
+        self._out = os.fdopen(os.dup(sys.__stdout__.fileno()), "w", encoding="utf-8")
+        read_fd, write_fd = os.pipe()
+        os.dup2(write_fd, sys.__stdout__.fileno())
+        os.close(write_fd)
+        threading.Thread(target=self._forward_fd_output, args=(read_fd,),
+                         name="KernelFdForwarder", daemon=True).start()
+
+    def _forward_fd_output(self, read_fd):
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        buffer = b""
+        while True:
+            data = os.read(read_fd, MAX_EVENT_TEXT)
+            if not data:
+                return
+            buffer += data
+            while (index := buffer.find(FD_SYNC)) != -1:
+                self._emit_fd_text(decoder.decode(buffer[:index]))
+                buffer = buffer[index + len(FD_SYNC):]
+                self._fd_synced.set()
+            # Holds back what may be the start of a marker split across reads
+            keep = next((n for n in range(len(FD_SYNC) - 1, 0, -1) if buffer.endswith(FD_SYNC[:n])), 0)
+            self._emit_fd_text(decoder.decode(buffer[:len(buffer) - keep]))
+            buffer = buffer[len(buffer) - keep:]
+
+    def _emit_fd_text(self, text):
+        if text:
+            self.emit({"id": self.current_id, "event": "stream", "name": "stdout", "text": text})
+
+    def _sync_fd_output(self):
+        """Waits until everything written to fd 1 so far has been forwarded."""
+        sys.__stdout__.flush()
+        self._fd_synced.clear()
+        os.write(sys.__stdout__.fileno(), FD_SYNC)
+        self._fd_synced.wait(1.0)
+
+    def _read_requests(self):
+        """
+        Runs on its own thread so interrupts and variable inspection are
+        answered while the main thread is busy executing a cell.
+        """
+        for line in self._request_stream:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError:
+                continue
+            command = request.get("command")
+            if command == "interrupt":
+                self.interrupt()
+            elif command == "variables":
+                self.emit({"id": request.get("id"), "event": "variables",
+                           "variables": self.variables(request.get("deep", False)),
+                           "memory": {"process_bytes": process_memory()}})
+            else:
+                self._requests.put(request)
+        self._requests.put(None)
+
+    def _flush_streams(self):
+        """Sends output that a cell wrote and then went quiet after (e.g. before a sleep)."""
+        while True:
+            time.sleep(STREAM_FLUSH_SECONDS)
+            for writer in self._writers:
+                writer.flush()
+
+    # --- Execution ---
+
+    def execute(self, request_id, code: str):
+        self.execution_count += 1
+        self.current_id = request_id
+        filename = f"<cell-{self.execution_count}>"
+        # Lets tracebacks show the cell's source lines
+        linecache.cache[filename] = (len(code), None, code.splitlines(keepends=True), filename)
+        stdin, stdout, stderr = sys.stdin, sys.stdout, sys.stderr
+        sys.stdin = NoInput()
+        sys.stdout = StreamWriter(self, request_id, "stdout")
+        sys.stderr = StreamWriter(self, request_id, "stderr")
+        self._writers = (sys.stdout, sys.stderr)
+        status = "ok"
+        start = time.perf_counter()
+        try:
+            tree = ast.parse(code, filename)
+            last_expr = None
+            if tree.body and isinstance(tree.body[-1], ast.Expr):
+                last_expr = ast.Expression(tree.body.pop().value)
+            exec(compile(tree, filename, "exec"), self.namespace)
+            if last_expr is not None:
+                value = eval(compile(last_expr, filename, "eval"), self.namespace)
+                if value is not None:
+                    self.namespace["_"] = value
+                    sys.stdout.flush()
+                    self.emit({"id": request_id, "event": "result", "repr": repr(value)[:MAX_RESULT_CHARS]})
+        except KeyboardInterrupt:
+            status = "interrupted"
+            sys.stderr.write("KeyboardInterrupt\n")
+        except BaseException as e:  # SystemExit from a script must not end the kernel
+            status = "error"
+            tb = e.__traceback__
+            if not isinstance(e, SyntaxError):
+                tb = tb.tb_next  # Drop this frame; the user's code starts below it
+            sys.stdout.flush()
+            sys.stderr.flush()
+            self.emit({"id": request_id, "event": "error", "ename": type(e).__name__, "evalue": str(e),
+                       "traceback": "".join(traceback.format_exception(type(e), e, tb))})
+        finally:
+            self._writers = ()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+        self._sync_fd_output()
+        self.emit({"id": request_id, "event": "done", "status": status,
+                   "execution_count": self.execution_count,
+                   "seconds": round(time.perf_counter() - start, 6)})
+        self.current_id = None
+
+    def interrupt(self):
+        if self.current_id is None:
+            return
+        if hasattr(signal, "pthread_kill"):
+            # A real signal also wakes blocking calls such as time.sleep
+            signal.pthread_kill(threading.main_thread().ident, signal.SIGINT)
+        else:
+            _thread.interrupt_main()
+
+    # --- Introspection ---
+
+    def variables(self, deep: bool = False) -> list:
+        """User variables, largest first. `deep` counts the contents of object columns."""
+        pd = sys.modules.get("pandas")
+        np = sys.modules.get("numpy")
+        result = []
+        for name, value in list(self.namespace.items()):
+            if name.startswith("_") or isinstance(value, (types.ModuleType, types.FunctionType, type)):
+                continue
+            info = {"name": name, "type": type(value).__name__}
+            try:
+                if pd is not None and isinstance(value, pd.DataFrame):
+                    info["shape"] = list(value.shape)
+                    info["bytes"] = int(value.memory_usage(index=True, deep=deep).sum())
+                    info["dtypes"] = {str(k): int(v) for k, v in value.dtypes.astype(str).value_counts().items()}
+                    info["columns"] = [str(c) for c in value.columns[:50]]
+                elif pd is not None and isinstance(value, (pd.Series, pd.Index)):
+                    info["shape"] = list(value.shape)
+                    info["dtype"] = str(value.dtype)
+                    info["bytes"] = int(value.memory_usage(deep=deep))
+                elif np is not None and isinstance(value, np.ndarray):
+                    info["shape"] = list(value.shape)
+                    info["dtype"] = str(value.dtype)
+                    info["bytes"] = int(value.nbytes)
+                else:
+                    info["bytes"] = sys.getsizeof(value)
+                    if hasattr(value, "__len__"):
+                        info["length"] = len(value)
+                    info["preview"] = _preview.repr(value)
+            except Exception as e:  # A broken __len__/__repr__ must not break the listing
+                info["preview"] = f"<unavailable: {e}>"
+            result.append(info)
+        result.sort(key=lambda v: v.get("bytes", 0), reverse=True)
+        return result
+
+
+class StreamWriter(io.TextIOBase):
+    """
+    Forwards writes as stream events, batching small writes for up to 50 ms.
+    Written to by the cell and flushed by the kernel's flusher thread too.
+    """
+
+    def __init__(self, kernel: Kernel, request_id, name: str):
+        self.kernel = kernel
+        self.request_id = request_id
+        self.name = name
+        self._buffer = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        if not isinstance(text, str):
+            raise TypeError(f"write() argument must be str, not {type(text).__name__}")
+        with self._lock:
+            self._buffer.append(text)
+            self._size += len(text)
+        if self._size >= MAX_EVENT_TEXT or time.monotonic() - self._last_flush >= STREAM_FLUSH_SECONDS:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        # Emitting under the lock keeps chunks in order when both threads flush at once
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._buffer:
+                return
+            text = "".join(self._buffer)
+            self._buffer, self._size = [], 0
+            for i in range(0, len(text), MAX_EVENT_TEXT):
+                self.kernel.emit({"id": self.request_id, "event": "stream", "name": self.name,
+                                  "text": text[i:i + MAX_EVENT_TEXT]})
+
+
+class NoInput(io.TextIOBase):
+    """A cell's stdin: the kernel's real stdin carries its requests, so there is nothing to read."""
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        raise EOFError("input() is not available in kernel cells; run the script in the terminal instead")
+
+    readline = read
+
+
+def process_memory():
+    """Resident memory of the kernel process in bytes, or None if unknown."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # Peak, not current
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        return None
+
+
+if __name__ == "__main__":
+    Kernel().serve()
@@ -0,0 +1,330 @@
+"""
+Loader Generator for AI IDE.
+Profiles a CSV in chunks and writes a pd.read_csv call that loads it with
+the smallest lossless dtypes: downcast ints/floats, nullable ints for gappy
+integer columns, category for low-cardinality strings, parsed dates and
+usecols that skip all-empty columns. The generated loader is then checked
+against a plain pd.read_csv, chunk by chunk, value by value.
+
+Usage:
+    loader_generator.py <csv or directory> [--no-verify] [--chunksize N]
+"""
+import sys
+import os
+import json
+import warnings
+import pandas as pd
+import numpy as np
+
+CHUNK_SIZE = 100_000
+CATEGORY_MAX_UNIQUE = 10_000
+CATEGORY_MAX_RATIO = 0.5
+DATE_SAMPLE = 200
+BOOL_VALUES = {"True", "False", "true", "false", "TRUE", "FALSE"}
+INT_TYPES = [("int8", 1), ("uint8", 1), ("int16", 2), ("uint16", 2),
+             ("int32", 4), ("uint32", 4), ("int64", 8), ("uint64", 8)]
+POINTER = 8
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:
+    guess_datetime_format = None
+
+
+class ColumnProfile:
+    """Running statistics for one column, updated one chunk at a time."""
+
+    def __init__(self, name, position):
+        self.name = name
+        self.position = position
+        self.rows = 0
+        self.nulls = 0
+        self.numeric = True
+        self.integral = True
+        self.float32_exact = True
+        self.minimum = None
+        self.maximum = None
+        self.boolean = True
+        self.uniques = set()
+        self.too_many_uniques = False
+        self.date_format = None
+        self.dates = None  # None = not tried yet
+        self.string_bytes = 0
+
+    def update(self, values: pd.Series):
+        self.rows += len(values)
+        present = values.dropna()
+        self.nulls += len(values) - len(present)
+        if present.empty:
+            return
+        self.string_bytes += int(present.map(sys.getsizeof).sum())
+
+        if self.numeric:
+            self._update_numeric(present)
+        if self.boolean:
+            self.boolean = bool(present.isin(BOOL_VALUES).all())
+        if not self.too_many_uniques:
+            self.uniques.update(present.unique())
+            if len(self.uniques) > CATEGORY_MAX_UNIQUE:
+                self.too_many_uniques = True
+                self.uniques = set()
+        if not self.numeric and not self.boolean and self.dates is not False:
+            self._update_dates(present)
+
+    def _update_numeric(self, present):
+        numbers = pd.to_numeric(present, errors="coerce")
+        if numbers.isna().any():
+            self.numeric = False
+            return
+        if numbers.dtype.kind in "iu":
+            lo, hi = int(numbers.min()), int(numbers.max())
+        else:
+            finite = np.isfinite(numbers)
+            if self.integral and not (finite.all() and (numbers == np.floor(numbers)).all()
+                                      and numbers.abs().max() < 2 ** 53):
+                self.integral = False
+            if self.float32_exact:
+                narrowed = numbers.astype("float32").astype("float64")
+                self.float32_exact = bool(((narrowed == numbers) | ~finite).all())
+            lo, hi = numbers.min(), numbers.max()
+            if self.integral:
+                lo, hi = int(lo), int(hi)
+        self.minimum = lo if self.minimum is None else min(self.minimum, lo)
+        self.maximum = hi if self.maximum is None else max(self.maximum, hi)
+
+    def _update_dates(self, present):
+        if self.dates is None:
+            sample = present.head(DATE_SAMPLE)
+            text = str(sample.iloc[0])
+            if not any(c.isdigit() for c in text) or not any(c in text for c in "-/:"):
+                self.dates = False
+                return
+            self.date_format = guess_datetime_format(text) if guess_datetime_format else None
+            # Without a fixed format pandas parses row by row, which is slow and ambiguous
+            self.dates = self.date_format is not None
+            if not self.dates:
+                return
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            parsed = pd.to_datetime(present, format=self.date_format, errors="coerce")
+        if parsed.isna().any():
+            self.dates = False
+
+    @property
+    def non_null(self) -> int:
+        return self.rows - self.nulls
+
+    def choose(self):
+        """Returns (dtype, reason, projected bytes); dtype 'datetime' means parse_dates."""
+        n = self.rows
+        if self.non_null == 0:
+            return None, "all values missing", 0
+        if self.numeric and self.integral:
+            for dtype, size in INT_TYPES:
+                info = np.iinfo(dtype)
+                if info.min <= self.minimum and self.maximum <= info.max:
+                    if self.nulls:
+                        nullable = dtype.capitalize().replace("Uint", "UInt")
+                        return nullable, f"integers {self.minimum}..{self.maximum} with gaps", n * (size + 1)
+                    return dtype, f"integers {self.minimum}..{self.maximum}", n * size
+        if self.numeric:
+            if self.float32_exact:
+                return "float32", "floats exact in single precision", n * 4
+            return "float64", "floats need double precision", n * 8
+        if self.boolean:
+            if self.nulls:
+                return "boolean", "true/false with gaps", n * 2
+            return "bool", "true/false", n
+        if self.dates:
+            return "datetime", f"dates ({self.date_format})", n * 8
+        if not self.too_many_uniques and len(self.uniques) <= CATEGORY_MAX_RATIO * self.non_null:
+            codes = 1 if len(self.uniques) < 2 ** 7 else 2 if len(self.uniques) < 2 ** 15 else 4
+            categories = sum(sys.getsizeof(u) for u in self.uniques) + POINTER * len(self.uniques)
+            return "category", f"{len(self.uniques)} distinct strings", n * codes + categories
+        return "object", "free text", self.baseline_bytes()
+
+    def baseline_bytes(self) -> int:
+        """What a plain read_csv would use for this column."""
+        if self.non_null == 0:
+            return self.rows * 8
+        if self.numeric:
+            return self.rows * 8
+        if self.boolean and not self.nulls:
+            return self.rows
+        # Missing cells in object columns are float NaNs (24 bytes each)
+        return self.rows * POINTER + self.string_bytes + self.nulls * sys.getsizeof(float("nan"))
+
+
+def resolve_csv(path: str) -> str:
+    if os.path.isdir(path):
+        files = sorted(f for f in os.listdir(path) if f.endswith('.csv'))
+        if not files:
+            raise FileNotFoundError("No CSV files found in directory")
+        return os.path.join(path, files[0])
+    return path
+
+
+def profile(csv_path: str, chunksize: int = CHUNK_SIZE) -> list:
+    """One pass over the file as strings, so no type guess is made before the end."""
+    profiles = None
+    for chunk in pd.read_csv(csv_path, dtype=str, chunksize=chunksize):
+        if profiles is None:
+            profiles = [ColumnProfile(name, i) for i, name in enumerate(chunk.columns)]
+        for p, (_, values) in zip(profiles, chunk.items()):
+            p.update(values)
+    if profiles is None:
+        raise ValueError("CSV has no header row")
+    return profiles
+
+
+def build_plan(profiles: list) -> dict:
+    columns, dropped, constant = [], [], []
+    for p in profiles:
+        dtype, reason, projected = p.choose()
+        if dtype is None:
+            dropped.append(p.name)
+            continue
+        if not p.nulls and not p.too_many_uniques and len(p.uniques) == 1:
+            constant.append(p.name)
+        columns.append({"name": p.name, "position": p.position, "dtype": dtype, "reason": reason,
+                        "date_format": p.date_format if dtype == "datetime" else None,
+                        "baseline_bytes": p.baseline_bytes(), "projected_bytes": projected})
+    return {"columns": columns, "dropped": dropped, "constant": constant}
+
+
+def loader_kwargs(plan: dict) -> dict:
+    kwargs = {}
+    if plan["dropped"]:
+        kwargs["usecols"] = [c["position"] for c in plan["columns"]]
+    dtypes = {c["name"]: c["dtype"] for c in plan["columns"] if c["dtype"] not in ("datetime", "object")}
+    if dtypes:
+        kwargs["dtype"] = dtypes
+    dates = [c for c in plan["columns"] if c["dtype"] == "datetime"]
+    if dates:
+        kwargs["parse_dates"] = [c["name"] for c in dates]
+        kwargs["date_format"] = {c["name"]: c["date_format"] for c in dates}
+    return kwargs
+
+
+def render_snippet(csv_path: str, kwargs: dict, plan: dict) -> str:
+    lines = ["import pandas as pd", ""]
+    if "dtype" in kwargs:
+        lines.append("dtypes = {")
+        reasons = {c["name"]: c["reason"] for c in plan["columns"]}
+        for name, dtype in kwargs["dtype"].items():
+            lines.append(f"    {name!r}: {dtype!r},  # {reasons[name]}")
+        lines.append("}")
+    args = [(repr(csv_path), None)]
+    if "usecols" in kwargs:
+        args.append((f"usecols={kwargs['usecols']!r}", "skips empty: " + ", ".join(map(str, plan["dropped"]))))
+    if "dtype" in kwargs:
+        args.append(("dtype=dtypes", None))
+    for key in ("parse_dates", "date_format"):
+        if key in kwargs:
+            args.append((f"{key}={kwargs[key]!r}", None))
+    lines.append("df = pd.read_csv(")
+    lines += [f"    {arg},  # {comment}" if comment else f"    {arg}," for arg, comment in args]
+    lines.append(")")
+    lines.append('print(f"{df.memory_usage(deep=True).sum() / 1e6:.1f} MB")')
+    return "\n".join(lines) + "\n"
+
+
+def _mismatch(base: pd.Series, loaded: pd.Series, column: dict):
+    """Returns the offset of the first differing value in a chunk, or None."""
+    base_na = base.isna().to_numpy()
+    loaded_na = loaded.isna().to_numpy()
+    differs = base_na != loaded_na
+    if differs.any():
+        return int(np.flatnonzero(differs)[0])
+    keep = ~base_na
+    expected = base[keep]
+    actual = loaded[keep]
+    if column["dtype"] == "datetime":
+        expected = pd.to_datetime(expected, format=column["date_format"])
+        actual = actual.astype(expected.dtype)
+    elif expected.dtype.kind in "biuf":
+        actual = actual.astype(expected.dtype)
+    else:
+        # Object columns can mix str and int cells across pandas' internal chunks
+        expected = expected.astype(str)
+        actual = actual.astype(str)
+    same = expected.to_numpy() == actual.to_numpy()
+    if not same.all():
+        return int(np.flatnonzero(keep)[np.flatnonzero(~same)[0]])
+    return None
+
+
+def _cell(value) -> str:
+    # NumPy scalars print rounded (float32 44.949); .item() shows the real value
+    return str(value.item() if isinstance(value, np.generic) else value)
+
+
+def verify(csv_path: str, kwargs: dict, plan: dict, chunksize: int = CHUNK_SIZE) -> dict:
+    """
+    Loads the file with the generated loader, then re-reads it with a plain
+    pd.read_csv in chunks and compares every kept cell, so only one baseline
+    chunk is ever in memory.
+    """
+    optimised = pd.read_csv(csv_path, **kwargs)
+    measured = int(optimised.memory_usage(index=False, deep=True).sum())
+    baseline = 0
+    mismatches = []
+    start = 0
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", pd.errors.DtypeWarning)
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+            baseline += int(chunk.memory_usage(index=False, deep=True).sum())
+            loaded_chunk = optimised.iloc[start:start + len(chunk)]
+            for column in plan["columns"]:
+                offset = _mismatch(chunk.iloc[:, column["position"]],
+                                   loaded_chunk[column["name"]], column)
+                if offset is not None and not any(m["column"] == column["name"] for m in mismatches):
+                    mismatches.append({"column": column["name"], "row": start + offset,
+                                       "expected": _cell(chunk.iloc[offset, column["position"]]),
+                                       "loaded": _cell(loaded_chunk[column["name"]].iloc[offset])})
+            start += len(chunk)
+    return {"lossless": not mismatches and start == len(optimised), "mismatches": mismatches,
+            "measured_bytes": measured, "baseline_measured_bytes": baseline}
+
+
+def generate_loader(path: str, check: bool = True, chunksize: int = CHUNK_SIZE) -> dict:
+    try:
+        csv_path = resolve_csv(path)
+        profiles = profile(csv_path, chunksize)
+        plan = build_plan(profiles)
+        kwargs = loader_kwargs(plan)
+        memory = {
+            "baseline_projected_bytes": sum(p.baseline_bytes() for p in profiles),
+            "projected_bytes": sum(c["projected_bytes"] for c in plan["columns"]),
+        }
+        result = {
+            "success": True,
+            "path": csv_path,
+            "rows": profiles[0].rows if profiles else 0,
+            "snippet": render_snippet(csv_path, kwargs, plan),
+            "columns": [{k: c[k] for k in ("name", "dtype", "reason")} for c in plan["columns"]],
+            "dropped": plan["dropped"],
+            "constant": plan["constant"],
+            "memory": memory,
+        }
+        if check:
+            outcome = verify(csv_path, kwargs, plan, chunksize)
+            memory["measured_bytes"] = outcome.pop("measured_bytes")
+            memory["baseline_measured_bytes"] = outcome.pop("baseline_measured_bytes")
+            result["verification"] = outcome
+        return result
+    except Exception as e:
+        return {"error": str(e)}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(json.dumps({"error": "No file path provided"}))
+        sys.exit(1)
+
+    args = sys.argv[1:]
+    chunksize = CHUNK_SIZE
+    if "--chunksize" in args:
+        chunksize = int(args[args.index("--chunksize") + 1])
+    result = generate_loader(args[0], check="--no-verify" not in args, chunksize=chunksize)
+    print(json.dumps(result))
@@ -0,0 +1,306 @@
+"""
+Row Server for AI IDE.
+Builds a compact row-offset index for each CSV (once, persisted next to the
+file as <name>.csv.rowidx) and serves row pages, column projections and
+filtered scans from a memory-mapped file, so reading row 5,000,000 costs the
+same as reading row 0.
+
+Usage:
+    row_server.py index <csv or directory>
+    row_server.py rows <csv> <start> <count> [col1,col2,...]
+    row_server.py scan <csv> <column> <op> <value> [start_row] [limit]
+    row_server.py serve            (JSON requests on stdin, one per line)
+"""
+import sys
+import os
+import io
+import csv
+import json
+import mmap
+import struct
+from array import array
+
+INDEX_SUFFIX = ".rowidx"
+MAGIC = b"ROWIDX02"  # Bumped when indexing changes, so stale indexes are rebuilt
+# magic, csv size, csv mtime_ns, number of offsets
+HEADER = struct.Struct("<8sQQQ")
+OFFSET = struct.Struct("<Q")
+CHUNK_SIZE = 1 << 20
+MAX_PAGE = 10000
+MAX_OPEN_INDEXES = 8  # serve keeps this many files mapped; the least recently used is closed
+
+OPERATORS = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+
+def build_offsets(csv_path: str) -> array:
+    """
+    Returns the byte offset of every record start plus a final end offset.
+    Follows csv.reader's quoting: a quote only opens a quoted field when it
+    is the first byte of a field (so `5" screen` is literal), and inside
+    one, `""` is an escaped quote. Newlines inside quoted fields do not
+    start a record.
+    """
+    offsets = array("Q", [0])
+    in_quotes = False
+    quote_pending = False  # The chunk ended on a quote inside a quoted field: closing, or half of ""
+    prev = b"\n"  # Last byte before the chunk; the file start counts as a field start
+    pos = 0
+    with open(csv_path, "rb") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            end = len(chunk)
+            i = 0
+            if quote_pending:
+                quote_pending = False
+                if chunk[:1] == b'"':
+                    i = 1
+                else:
+                    in_quotes = False
+            while i < end:
+                q = chunk.find(b'"', i)
+                if in_quotes:
+                    if q == -1:
+                        break
+                    if q + 1 == end:
+                        quote_pending = True
+                        break
+                    if chunk[q + 1] == 0x22:  # "" inside a quoted field
+                        i = q + 2
+                    else:
+                        in_quotes = False
+                        i = q + 1
+                    continue
+                stop = q if q != -1 else end
+                nl = chunk.find(b"\n", i, stop)
+                while nl != -1:
+                    offsets.append(pos + nl + 1)
+                    nl = chunk.find(b"\n", nl + 1, stop)
+                if q == -1:
+                    break
+                before = chunk[q - 1] if q else prev[0]
+                if before in (0x2C, 0x0A) or (pos == 0 and q == 3 and chunk.startswith(b"\xef\xbb\xbf")):
+                    in_quotes = True
+                i = q + 1
+            prev = chunk[-1:]
+            pos += end
+    if offsets[-1] != pos:
+        offsets.append(pos)  # Last record has no trailing newline
+    return offsets
+
+
+class RowIndex:
+    """A CSV file plus its persisted offset index, both memory-mapped."""
+
+    def __init__(self, csv_path: str):
+        self.csv_path = csv_path
+        self.index_path = csv_path + INDEX_SUFFIX
+        stat = os.stat(csv_path)
+        self._identity = (stat.st_size, stat.st_mtime_ns)
+        if not self._index_is_current(stat):
+            self._write_index(stat)
+
+        self._csv_file = open(csv_path, "rb")
+        self._index_file = open(self.index_path, "rb")
+        self.data = mmap.mmap(self._csv_file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b""
+        self.index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.record_count = HEADER.unpack_from(self.index, 0)[3] - 1
+        self.columns = self._parse(0, 1)[0] if self.record_count else []
+
+    @property
+    def row_count(self) -> int:
+        """Data rows, excluding the header record."""
+        return max(self.record_count - 1, 0)
+
+    def is_current(self) -> bool:
+        """False once the CSV has been rewritten since this index was opened."""
+        try:
+            stat = os.stat(self.csv_path)
+        except OSError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == self._identity
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.index.close()
+        self._csv_file.close()
+        self._index_file.close()
+
+    def _index_is_current(self, stat) -> bool:
+        try:
+            with open(self.index_path, "rb") as f:
+                magic, size, mtime_ns, _ = HEADER.unpack(f.read(HEADER.size))
+            return magic == MAGIC and size == stat.st_size and mtime_ns == stat.st_mtime_ns
+        except (OSError, struct.error):
+            return False
+
+    def _write_index(self, stat):
+        offsets = build_offsets(self.csv_path)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, stat.st_size, stat.st_mtime_ns, len(offsets)))
+            offsets.tofile(f)
+        os.replace(tmp_path, self.index_path)
+
+    def _offset(self, record: int) -> int:
+        return OFFSET.unpack_from(self.index, HEADER.size + OFFSET.size * record)[0]
+
+    def _parse(self, first_record: int, count: int) -> list:
+        """Parses `count` consecutive records with one slice of the mapped file."""
+        start = self._offset(first_record)
+        end = self._offset(first_record + count)
+        text = self.data[start:end].decode("utf-8", errors="replace")
+        if first_record == 0:
+            text = text.lstrip("\ufeff")
+        return list(csv.reader(io.StringIO(text, newline="")))
+
+    def _projection(self, columns):
+        if not columns:
+            return list(range(len(self.columns)))
+        indices = []
+        for column in columns:
+            if column in self.columns:
+                indices.append(self.columns.index(column))
+            elif column.isdigit() and int(column) < len(self.columns):
+                indices.append(int(column))
+            else:
+                raise KeyError(f"Unknown column: {column}")
+        return indices
+
+    def rows(self, start: int, count: int, columns=None) -> dict:
+        start = max(start, 0)
+        count = max(min(count, MAX_PAGE, self.row_count - start), 0)
+        indices = self._projection(columns)
+        records = self._parse(start + 1, count) if count else []
+        return {
+            "columns": [self.columns[i] for i in indices],
+            "start": start,
+            "rows": [[r[i] if i < len(r) else None for i in indices] for r in records],
+            "total_rows": self.row_count,
+        }
+
+    def scan(self, column: str, op: str, value: str, start: int = 0, limit: int = 100,
+             columns=None, batch: int = 1000) -> dict:
+        """
+        Returns up to `limit` rows matching `column <op> value`, starting at
+        `start`. `next_row` continues the scan. Numeric comparison is used
+        when both sides parse as numbers; `contains` is a substring test.
+        """
+        key = self._projection([column])[0]
+        indices = self._projection(columns)
+        if op == "contains":
+            matches = lambda cell: value.lower() in cell.lower()
+        elif op in OPERATORS:
+            compare = OPERATORS[op]
+            number = _to_number(value)
+
+            def matches(cell):
+                cell_number = _to_number(cell)
+                if number is not None and cell_number is not None:
+                    return compare(cell_number, number)
+                return compare(cell, value)
+        else:
+            raise ValueError(f"Unknown operator: {op}")
+
+        found = []
+        row = max(start, 0)
+        next_row = None
+        while row < self.row_count and next_row is None:
+            count = min(batch, self.row_count - row)
+            for offset, record in enumerate(self._parse(row + 1, count)):
+                if key < len(record) and matches(record[key]):
+                    found.append([row + offset] + [record[i] if i < len(record) else None for i in indices])
+                    if len(found) >= limit:
+                        next_row = row + offset + 1
+                        break
+            row += count
+        return {
+            "columns": ["__row__"] + [self.columns[i] for i in indices],
+            "rows": found,
+            "next_row": next_row if next_row is not None and next_row < self.row_count else None,
+            "total_rows": self.row_count,
+        }
+
+
+def _to_number(text):
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return None
+
+
+def index_path(path: str) -> dict:
+    """Builds (or validates) the index of one CSV, or every CSV under a directory."""
+    if os.path.isdir(path):
+        csv_files = [os.path.join(root, f) for root, _, files in os.walk(path)
+                     for f in files if f.lower().endswith(".csv")]
+    else:
+        csv_files = [path]
+    results = []
+    for csv_file in csv_files:
+        index = RowIndex(csv_file)
+        results.append({"path": csv_file, "rows": index.row_count, "columns": index.columns})
+        index.close()
+    return {"success": True, "data": results}
+
+
+def handle(command: str, args: list, indexes: dict) -> dict:
+    def get_index(path):
+        index = indexes.pop(path, None)
+        if index is not None and not index.is_current():
+            index.close()
+            index = None
+        if index is None:
+            index = RowIndex(path)
+        indexes[path] = index  # Re-inserted, so dict order is least recently used first
+        while len(indexes) > MAX_OPEN_INDEXES:
+            indexes.pop(next(iter(indexes))).close()
+        return index
+
+    if command == "index":
+        return index_path(args[0])
+    if command == "rows":
+        columns = args[3].split(",") if len(args) > 3 and args[3] else None
+        return {"success": True, **get_index(args[0]).rows(int(args[1]), int(args[2]), columns)}
+    if command == "scan":
+        start = int(args[4]) if len(args) > 4 and args[4] else 0
+        limit = int(args[5]) if len(args) > 5 and args[5] else 100
+        return {"success": True, **get_index(args[0]).scan(args[1], args[2], args[3], start, limit)}
+    return {"error": "Invalid command"}
+
+
+def serve():
+    """Answers {"command": ..., "args": [...]} requests, keeping indexes mapped between them."""
+    indexes = {}
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            result = handle(request["command"], [str(a) for a in request.get("args", [])], indexes)
+        except Exception as e:
+            result = {"error": str(e)}
+        print(json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(json.dumps({"error": "No command provided"}))
+        sys.exit(1)
+
+    if sys.argv[1] == "serve":
+        serve()
+    else:
+        try:
+            print(json.dumps(handle(sys.argv[1], sys.argv[2:], {})))
+        except Exception as e:
+            print(json.dumps({"error": str(e)}))
@@ -0,0 +1,47 @@
+"""Tests for row_server's offset index; run with `python -m pytest` from AI-IDE/py."""
+import csv
+import io
+
+import pytest
+
+import row_server
+
+
+def records_by_offsets(data: bytes, offsets) -> list:
+    """Parses every indexed record on its own, the way RowIndex._parse does."""
+    records = []
+    for start, end in zip(offsets, offsets[1:]):
+        records.extend(csv.reader(io.StringIO(data[start:end].decode(), newline="")))
+    return records
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1 << 20])
+@pytest.mark.parametrize("data", [
+    b'name,size,price\nmonitor,5" screen,2\ntv,40" screen,3\nradio,none,4\n',
+    b'id,text\n1,"multi\nline"\n2,"has ""quotes"" and, comma"\n3,"ends with quote"""\n',
+    b'id,text\n1,"closed"then text\n2,x"y"z\n3,last',
+    b'\xef\xbb\xbfa,b\n"1\n2",3\n',
+])
+def test_offsets_split_records_like_csv_reader(tmp_path, monkeypatch, data, chunk_size):
+    monkeypatch.setattr(row_server, "CHUNK_SIZE", chunk_size)
+    path = tmp_path / "data.csv"
+    path.write_bytes(data)
+
+    offsets = row_server.build_offsets(str(path))
+
+    expected = list(csv.reader(io.StringIO(data.decode(), newline="")))
+    assert records_by_offsets(data, offsets) == expected
+    assert len(offsets) - 1 == len(expected)
+
+
+def test_stray_inch_mark_does_not_merge_rows(tmp_path):
+    path = tmp_path / "screens.csv"
+    path.write_bytes(b'a,b,c\n1,5" screen,2\n3,4,5\n6,7,8\n')
+
+    index = row_server.RowIndex(str(path))
+    try:
+        assert index.row_count == 3
+        assert index.rows(0, 10)["rows"] == [["1", '5" screen', "2"], ["3", "4", "5"], ["6", "7", "8"]]
+        assert index.scan("a", "==", "6")["rows"] == [[2, "6", "7", "8"]]
+    finally:
+        index.close()
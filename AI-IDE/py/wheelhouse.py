@@ -0,0 +1,187 @@
+"""
+Wheelhouse for AI IDE.
+Installs packages from a local wheel directory with --no-index, so installs
+in fresh venvs and on offline machines never need the network. Packages that
+are not cached yet are fetched once (with their full dependency set) and
+captured as wheels first. The wheelhouse can be prewarmed from a
+requirements file.
+
+IDE_WHEELHOUSE moves the wheelhouse, IDE_PACKAGE_INDEX fetches from an index
+URL or a local wheel directory instead of pip's default, and IDE_OFFLINE=1
+forbids fetching.
+
+The Wheelhouse class is a copy of the one in the PyQt IDE's wheelhouse.py (the
+apps in this repo are self-contained); keep fixes to it in sync. Only the
+defaults, stderr logging and the JSON CLI differ.
+
+Usage:
+    wheelhouse.py install <package> [<package> ...]
+    wheelhouse.py prewarm <requirements.txt>
+    wheelhouse.py list
+"""
+import sys
+import os
+import json
+import time
+import socket
+import tempfile
+import subprocess
+from urllib.parse import urlparse, unquote
+
+WHEELHOUSE_DIR = os.environ.get("IDE_WHEELHOUSE") or os.path.join(
+    os.path.expanduser("~"), ".ai_ide", "wheelhouse")
+MANIFEST_FILE = "manifest.json"
+DEFAULT_INDEX = "https://pypi.org/simple"
+
+
+def log(message: str):
+    # Progress goes to stderr so it shows in the terminal without breaking the JSON result
+    print(f"[Wheelhouse] {message}", file=sys.stderr, flush=True)
+
+
+class Wheelhouse:
+    """Installs packages from a local wheel directory, capturing new ones on first use."""
+
+    def __init__(self, path=WHEELHOUSE_DIR, index=None, python=sys.executable, output=None, log=log):
+        self.path = path
+        self.index = index if index is not None else os.environ.get("IDE_PACKAGE_INDEX")
+        self.python = python
+        self.output = output  # Where pip's own output goes; None inherits stdout
+        self.log = log
+        self._offline = None
+        os.makedirs(path, exist_ok=True)
+
+    # --- Public API ---
+
+    def install(self, requirements):
+        """Installs from the wheelhouse, fetching and capturing whatever is not there yet."""
+        requirements = list(requirements)
+        if self._pip("install", *self._local_args(), *requirements, quiet=True) == 0:
+            self.log(f"Installed {', '.join(requirements)} from {self.path}")
+            return True
+        if self.is_offline():
+            self.log(f"Offline and {', '.join(requirements)} not in the wheelhouse")
+            return False
+        if not self.capture(requirements):
+            return False
+        return self._pip("install", *self._local_args(), *requirements) == 0
+
+    def capture(self, requirements):
+        """Builds wheels for the requirements and all their dependencies into the wheelhouse."""
+        requirements = list(requirements)
+        self.log(f"Capturing {', '.join(requirements)}...")
+        if self._pip("wheel", "--wheel-dir", self.path, "--find-links", self.path,
+                     *self._index_args(), *requirements) != 0:
+            self.log(f"Failed to fetch {', '.join(requirements)}")
+            return False
+        manifest = self.manifest()
+        for requirement in requirements:
+            manifest[requirement] = {"wheels": self._resolve(requirement), "time": time.time()}
+        self._save_manifest(manifest)
+        return True
+
+    def prewarm(self, requirements_file):
+        """Captures every requirement in a requirements file that is not cached yet."""
+        with open(requirements_file, "r", encoding="utf-8") as f:
+            requirements = [line.split("#", 1)[0].strip() for line in f]
+        requirements = [r for r in requirements if r and not r.startswith("-")]
+        missing = [r for r in requirements if not self.has(r)]
+        if not missing:
+            self.log(f"All {len(requirements)} requirements already cached")
+            return True
+        return self.capture(missing)
+
+    def has(self, requirement):
+        """True if the requirement was captured and all of its wheels are still present."""
+        wheels = self.manifest().get(requirement, {}).get("wheels")
+        return bool(wheels) and all(os.path.exists(os.path.join(self.path, w)) for w in wheels)
+
+    def manifest(self):
+        try:
+            with open(os.path.join(self.path, MANIFEST_FILE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def is_offline(self):
+        if self._offline is None:
+            if os.environ.get("IDE_OFFLINE") == "1":
+                self._offline = True
+            elif self.index and os.path.isdir(self.index):
+                self._offline = False
+            else:
+                url = urlparse(self.index or os.environ.get("PIP_INDEX_URL") or DEFAULT_INDEX)
+                try:
+                    port = url.port or (443 if url.scheme == "https" else 80)
+                    socket.create_connection((url.hostname, port), timeout=2).close()
+                    self._offline = False
+                except (OSError, ValueError):
+                    self._offline = True
+        return self._offline
+
+    # --- Helpers ---
+
+    def _local_args(self):
+        return ["--no-index", "--find-links", self.path]
+
+    def _index_args(self):
+        if not self.index:
+            return []
+        if os.path.isdir(self.index):
+            return ["--no-index", "--find-links", self.index]
+        return ["--index-url", self.index]
+
+    def _resolve(self, requirement):
+        """Wheel file names pip picks from the wheelhouse for one requirement, or None."""
+        fd, report_path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            if self._pip("install", "--dry-run", "--ignore-installed", "--report", report_path,
+                         *self._local_args(), requirement, quiet=True) != 0:
+                return None
+            with open(report_path, "r", encoding="utf-8") as f:
+                report = json.load(f)
+            return sorted(os.path.basename(unquote(urlparse(item["download_info"]["url"]).path))
+                          for item in report.get("install", []))
+        except (OSError, ValueError, KeyError):
+            return None
+        finally:
+            os.remove(report_path)
+
+    def _save_manifest(self, manifest):
+        path = os.path.join(self.path, MANIFEST_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def _pip(self, *args, quiet=False):
+        command = [self.python, "-m", "pip", *args, "--disable-pip-version-check"]
+        if quiet:
+            return subprocess.call(command + ["--quiet"], stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL)
+        return subprocess.call(command, stdout=self.output)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(json.dumps({"error": "No command provided"}))
+        sys.exit(1)
+
+    command, args = sys.argv[1], sys.argv[2:]
+    try:
+        # pip's own output also goes to stderr; stdout is kept for the JSON result
+        wheelhouse = Wheelhouse(output=sys.stderr)
+        if command == "install":
+            ok = wheelhouse.install(args)
+            result = {"success": True, "installed": args} if ok else {"error": "Install failed"}
+        elif command == "prewarm":
+            ok = wheelhouse.prewarm(args[0])
+            result = {"success": True, "cached": sorted(wheelhouse.manifest())} if ok else {"error": "Prewarm failed"}
+        elif command == "list":
+            result = {"success": True, "path": wheelhouse.path, "packages": wheelhouse.manifest()}
+        else:
+            result = {"error": "Invalid command"}
+    except Exception as e:
+        result = {"error": str(e)}
+    print(json.dumps(result))
+    sys.exit(0 if "error" not in result else 1)
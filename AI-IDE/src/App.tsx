@@ -1,8 +1,9 @@
 import { useState, useRef } from 'react'
-import { Monitor, Server, Play, Database, ChevronRight, Activity, Search } from 'lucide-react'
+import { Monitor, Server, Play, Database, ChevronRight, Activity, Search, Square, RotateCcw } from 'lucide-react'
 import CodeEditor from './components/editor/CodeEditor'
 import FileExplorer from './components/common/FileExplorer'
 import Terminal from './components/common/Terminal'
+import KernelVariables from './components/common/KernelVariables'
 import './App.css'
 
 type ComputeMode = 'local' | 'colab'
@@ -25,6 +26,7 @@ import kaggle
 # Your code here...
 `)
   const [currentFile, setCurrentFile] = useState<string | null>(null)
+  const [kernelBusy, setKernelBusy] = useState(false)
 
   // Resizable panels
   const [explorerWidth, setExplorerWidth] = useState(250)
@@ -61,8 +63,8 @@ import kaggle
     // Check dependencies - only install if actually missing
     const depResult = await window.analysis.checkDeps(filePath)
     if (depResult.missing && depResult.missing.length > 0) {
-      const packages = depResult.missing.join(' ')
-      window.terminal.send(`pip install -q ${packages} && python "${filePath}"\n`)
+      const install = depResult.installCommand ?? `pip install -q ${depResult.missing.join(' ')}`
+      window.terminal.send(`${install} && python "${filePath}"\n`)
     } else {
       window.terminal.send(`python "${filePath}"\n`)
     }
@@ -70,6 +72,21 @@ import kaggle
 
 
 
+  // Cells run in the persistent kernel, so loaded datasets stay in memory between runs
+  const handleRunCell = async (code: string) => {
+    setKernelBusy(true)
+    try {
+      await window.kernel.execute(code)
+    } finally {
+      setKernelBusy(false)
+    }
+  }
+
+  const handleRestartKernel = async () => {
+    await window.kernel.restart()
+    setKernelBusy(false)
+  }
+
   const handleKaggleSearch = async () => {
     if (!kaggleQuery.trim()) return
     setIsSearching(true)
@@ -183,6 +200,37 @@ else:
             Run
           </button>
 
+          {/* Kernel Controls */}
+          <div style={{ display: 'flex', alignItems: 'center', gap: '6px' }}>
+            <button
+              onClick={() => handleRunCell(editorCode)}
+              disabled={kernelBusy}
+              title="Run in kernel (Ctrl+Enter runs the selection)"
+              style={{
+                padding: '6px 12px',
+                borderRadius: '6px',
+                fontSize: '0.8rem',
+                display: 'flex',
+                alignItems: 'center',
+                gap: '6px',
+                border: '1px solid #22c55e',
+                color: '#22c55e',
+                opacity: kernelBusy ? 0.6 : 1
+              }}
+            >
+              <Play size={14} />
+              {kernelBusy ? 'Running...' : 'Run Cell'}
+            </button>
+            {kernelBusy && (
+              <button onClick={() => window.kernel.interrupt()} title="Interrupt kernel" style={{ color: '#ef4444' }}>
+                <Square size={16} />
+              </button>
+            )}
+            <button onClick={handleRestartKernel} title="Restart kernel" style={{ color: 'var(--text-secondary)' }}>
+              <RotateCcw size={16} />
+            </button>
+          </div>
+
           {/* Compute Toggle */}
           <div style={{ display: 'flex', background: 'var(--bg-primary)', padding: '4px', borderRadius: '6px', border: '1px solid var(--border-color)' }}>
             <button
@@ -255,6 +303,7 @@ else:
                   key={currentFile || 'default'}
                   initialValue={editorCode}
                   onChange={(val) => setEditorCode(val || '')}
+                  onRunSelection={handleRunCell}
                 />
               </div>
               <div style={{ height: '200px', borderTop: '1px solid var(--border-color)', background: '#0f1117' }}>
@@ -352,6 +401,8 @@ else:
                       ))
                     )}
                   </div>
+
+                  <KernelVariables />
                 </div>
               </>
             )}
@@ -0,0 +1,65 @@
+import React, { useEffect, useState } from 'react'
+import { Cpu, RefreshCw } from 'lucide-react'
+
+const formatBytes = (bytes?: number | null) => {
+    if (bytes == null) return '?'
+    if (bytes < 1024) return `${bytes} B`
+    if (bytes < 1024 * 1024) return `${(bytes / 1024).toFixed(1)} KB`
+    return `${(bytes / (1024 * 1024)).toFixed(1)} MB`
+}
+
+const KernelVariables: React.FC = () => {
+    const [variables, setVariables] = useState<KernelVariable[]>([])
+    const [processBytes, setProcessBytes] = useState<number | null>(null)
+
+    const refresh = async (deep = false) => {
+        const result = await window.kernel.variables(deep)
+        if (result.event !== 'variables') return
+        setVariables(result.variables || [])
+        setProcessBytes(result.memory?.process_bytes ?? null)
+    }
+
+    useEffect(() => {
+        // Refreshed after every cell; the kernel is not started just to show an empty list
+        return window.kernel.onEvent((event) => {
+            if (event.event === 'done' && event.status !== 'dead') refresh()
+            else if (event.event === 'exit') {
+                setVariables([])
+                setProcessBytes(null)
+            }
+        })
+    }, [])
+
+    return (
+        <div style={{ borderTop: '1px solid var(--border-color)', paddingTop: '0.75rem', marginTop: '0.75rem', maxHeight: '40%', display: 'flex', flexDirection: 'column' }}>
+            <div style={{ display: 'flex', alignItems: 'center', justifyContent: 'space-between', marginBottom: '0.5rem' }}>
+                <h3 style={{ fontSize: '0.9rem', fontWeight: 600, display: 'flex', alignItems: 'center', gap: '8px' }}>
+                    <Cpu size={16} color="var(--accent-primary)" />
+                    Kernel Variables
+                </h3>
+                <button onClick={() => refresh(true)} title="Refresh (deep memory count)" style={{ color: 'var(--text-secondary)' }}>
+                    <RefreshCw size={14} />
+                </button>
+            </div>
+            {processBytes != null && (
+                <p style={{ fontSize: '0.7rem', color: 'var(--text-secondary)', marginBottom: '0.5rem' }}>Kernel memory: {formatBytes(processBytes)}</p>
+            )}
+            <div style={{ overflowY: 'auto' }}>
+                {variables.length === 0 ? (
+                    <p style={{ fontSize: '0.75rem', color: 'var(--text-secondary)', fontStyle: 'italic' }}>Run a cell with Ctrl+Enter</p>
+                ) : (
+                    variables.map((v) => (
+                        <div key={v.name} title={v.columns?.join(', ') || v.preview} style={{ display: 'flex', justifyContent: 'space-between', fontSize: '0.75rem', padding: '4px 0', borderBottom: '1px solid var(--border-color)' }}>
+                            <span style={{ fontFamily: 'monospace' }}>{v.name}</span>
+                            <span style={{ color: 'var(--text-secondary)' }}>
+                                {v.type}{v.shape ? ` ${v.shape.join('×')}` : ''} • {formatBytes(v.bytes)}
+                            </span>
+                        </div>
+                    ))
+                )}
+            </div>
+        </div>
+    )
+}
+
+export default KernelVariables
@@ -62,6 +62,23 @@ const Terminal: React.FC = () => {
             term.write(data)
         })
 
+        // Kernel output (cells run with Ctrl+Enter)
+        const toTerminal = (text: string) => text.replace(/\r?\n/g, '\r\n')
+        const cleanupKernel = window.kernel.onEvent((event) => {
+            if (event.event === 'stream' && event.text) {
+                term.write(event.name === 'stderr' ? `\x1b[31m${toTerminal(event.text)}\x1b[0m` : toTerminal(event.text))
+            } else if (event.event === 'result' && event.repr) {
+                term.write(toTerminal(event.repr) + '\r\n')
+            } else if (event.event === 'error' && event.traceback) {
+                term.write(`\x1b[31m${toTerminal(event.traceback)}\x1b[0m`)
+            } else if (event.event === 'done') {
+                const elapsed = event.seconds != null ? ` in ${(event.seconds * 1000).toFixed(1)} ms` : ''
+                term.write(`\x1b[2m[${event.execution_count ?? '-'}] ${event.status}${elapsed}\x1b[0m\r\n`)
+            } else if (event.event === 'exit') {
+                term.write('\r\n[Kernel stopped]\r\n')
+            }
+        })
+
         // Resize observer
         const resizeObserver = new ResizeObserver(() => {
             fitAddon.fit()
@@ -71,6 +88,7 @@ const Terminal: React.FC = () => {
         return () => {
             term.dispose()
             cleanup()
+            cleanupKernel()
             resizeObserver.disconnect()
         }
     }, [])
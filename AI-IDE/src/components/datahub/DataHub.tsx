@@ -1,5 +1,5 @@
 import React, { useState } from 'react'
-import { Database, Plus, Search, FileSpreadsheet, BarChart2, Activity, Loader } from 'lucide-react'
+import { Database, Plus, Search, FileSpreadsheet, BarChart2, Activity, Loader, Cpu } from 'lucide-react'
 
 interface Dataset {
     id: string
@@ -19,6 +19,8 @@ const DataHub: React.FC = () => {
     const [analyzing, setAnalyzing] = useState(false)
     const [importing, setImporting] = useState(false)
     const [recommendation, setRecommendation] = useState<string | null>(null)
+    const [loaderCode, setLoaderCode] = useState<string | null>(null)
+    const [loaderInfo, setLoaderInfo] = useState('')
     const [statusMsg, setStatusMsg] = useState('')
 
     const handleImport = async () => {
@@ -69,6 +71,30 @@ const DataHub: React.FC = () => {
         }
     }
 
+    const handleGenerateLoader = async (ds: Dataset) => {
+        if (!ds.path) {
+            setLoaderInfo('Error: Dataset path unknown (mocked dataset?)')
+            return
+        }
+        setAnalyzing(true)
+        const res = await window.analysis.generateLoader(ds.path)
+        setAnalyzing(false)
+        if (res.error) {
+            setLoaderCode(null)
+            setLoaderInfo('Error: ' + res.error)
+            return
+        }
+        const mb = (bytes: number) => (bytes / 1e6).toFixed(1) + ' MB'
+        const memory = res.memory
+        const before = memory.baseline_measured_bytes ?? memory.baseline_projected_bytes
+        const after = memory.measured_bytes ?? memory.projected_bytes
+        const check = res.verification
+            ? (res.verification.lossless ? ' • verified lossless' : ' • NOT lossless: ' + res.verification.mismatches.map((m: any) => m.column).join(', '))
+            : ''
+        setLoaderInfo(`${mb(before)} → ${mb(after)}${check}`)
+        setLoaderCode(res.snippet)
+    }
+
     return (
         <div style={{ padding: '2rem', height: '100%', display: 'flex', flexDirection: 'column', gap: '2rem', color: 'var(--text-primary)' }}>
             {/* Header */}
@@ -155,42 +181,63 @@ const DataHub: React.FC = () => {
                                         </div>
                                     </div>
                                 </div>
-                                <button
-                                    onClick={() => {
-                                        if (ds.path) {
-                                            setAnalyzing(true)
-                                            window.analysis.recommend(ds.path).then((res: any) => {
-                                                setAnalyzing(false)
-                                                if (res.error) setRecommendation('Error: ' + res.error)
-                                                else setRecommendation(res.recommendation)
-                                            })
-                                        } else {
-                                            setRecommendation('Error: Dataset path unknown (mocked dataset?)')
-                                        }
-                                    }}
-                                    disabled={analyzing}
-                                    style={{
-                                        padding: '8px 12px',
-                                        background: 'var(--bg-secondary)',
-                                        border: '1px solid var(--accent-primary)',
-                                        color: 'var(--accent-primary)',
-                                        borderRadius: '4px',
-                                        fontSize: '0.8rem',
-                                        display: 'flex',
-                                        alignItems: 'center',
-                                        gap: '6px',
-                                        opacity: analyzing ? 0.7 : 1
-                                    }}
-                                >
-                                    {analyzing ? (
-                                        <>Running...</>
-                                    ) : (
-                                        <>
-                                            <BarChart2 size={14} />
-                                            Analyze & Recommend
-                                        </>
-                                    )}
-                                </button>
+                                <div style={{ display: 'flex', gap: '8px' }}>
+                                    <button
+                                        onClick={() => {
+                                            if (ds.path) {
+                                                setAnalyzing(true)
+                                                window.analysis.recommend(ds.path).then((res: any) => {
+                                                    setAnalyzing(false)
+                                                    if (res.error) setRecommendation('Error: ' + res.error)
+                                                    else setRecommendation(res.recommendation)
+                                                })
+                                            } else {
+                                                setRecommendation('Error: Dataset path unknown (mocked dataset?)')
+                                            }
+                                        }}
+                                        disabled={analyzing}
+                                        style={{
+                                            padding: '8px 12px',
+                                            background: 'var(--bg-secondary)',
+                                            border: '1px solid var(--accent-primary)',
+                                            color: 'var(--accent-primary)',
+                                            borderRadius: '4px',
+                                            fontSize: '0.8rem',
+                                            display: 'flex',
+                                            alignItems: 'center',
+                                            gap: '6px',
+                                            opacity: analyzing ? 0.7 : 1
+                                        }}
+                                    >
+                                        {analyzing ? (
+                                            <>Running...</>
+                                        ) : (
+                                            <>
+                                                <BarChart2 size={14} />
+                                                Analyze & Recommend
+                                            </>
+                                        )}
+                                    </button>
+                                    <button
+                                        onClick={() => handleGenerateLoader(ds)}
+                                        disabled={analyzing}
+                                        style={{
+                                            padding: '8px 12px',
+                                            background: 'var(--bg-secondary)',
+                                            border: '1px solid var(--accent-secondary)',
+                                            color: 'var(--accent-secondary)',
+                                            borderRadius: '4px',
+                                            fontSize: '0.8rem',
+                                            display: 'flex',
+                                            alignItems: 'center',
+                                            gap: '6px',
+                                            opacity: analyzing ? 0.7 : 1
+                                        }}
+                                    >
+                                        <Cpu size={14} />
+                                        Optimised Loader
+                                    </button>
+                                </div>
                             </div>
                         ))}
                     </div>
@@ -213,6 +260,16 @@ const DataHub: React.FC = () => {
                             Select a dataset and click "Analyze" to see model recommendations.
                         </div>
                     )}
+
+                    {loaderInfo && (
+                        <div style={{ marginTop: '1rem', background: 'var(--bg-primary)', padding: '1rem', borderRadius: '6px', borderLeft: '4px solid var(--accent-secondary)' }}>
+                            <h4 style={{ fontSize: '0.9rem', marginBottom: '0.5rem', color: 'var(--accent-secondary)' }}>Memory-Optimised Loader</h4>
+                            <div style={{ fontSize: '0.8rem', color: loaderInfo.startsWith('Error') ? 'red' : 'var(--text-secondary)', marginBottom: '0.5rem' }}>{loaderInfo}</div>
+                            {loaderCode && (
+                                <pre style={{ fontSize: '0.75rem', overflowX: 'auto', whiteSpace: 'pre' }}>{loaderCode}</pre>
+                            )}
+                        </div>
+                    )}
                 </div>
             </div>
         </div>
@@ -1,10 +1,11 @@
-import React from 'react'
-import Editor from '@monaco-editor/react'
+import React, { useRef } from 'react'
+import Editor, { OnMount } from '@monaco-editor/react'
 
 interface CodeEditorProps {
     initialValue?: string
     language?: string
     onChange?: (value: string | undefined) => void
+    onRunSelection?: (code: string) => void
     theme?: 'vs-dark' | 'light'
 }
 
@@ -12,8 +13,24 @@ const CodeEditor: React.FC<CodeEditorProps> = ({
     initialValue = '# Write your code here',
     language = 'python',
     onChange,
+    onRunSelection,
     theme = 'vs-dark'
 }) => {
+    // Monaco keeps the command registered at mount, so it reads the latest callback from a ref
+    const runSelectionRef = useRef(onRunSelection)
+    runSelectionRef.current = onRunSelection
+
+    // Ctrl/Cmd+Enter sends the selection (or the whole file) to the kernel
+    const handleMount: OnMount = (editor, monaco) => {
+        editor.addCommand(monaco.KeyMod.CtrlCmd | monaco.KeyCode.Enter, () => {
+            const model = editor.getModel()
+            const selection = editor.getSelection()
+            if (!model || !runSelectionRef.current) return
+            const selected = selection && !selection.isEmpty() ? model.getValueInRange(selection) : ''
+            runSelectionRef.current(selected || model.getValue())
+        })
+    }
+
     return (
         <div style={{ width: '100%', height: '100%', overflow: 'hidden' }}>
             <Editor
@@ -22,6 +39,7 @@ const CodeEditor: React.FC<CodeEditorProps> = ({
                 defaultValue={initialValue}
                 theme={theme}
                 onChange={onChange}
+                onMount={handleMount}
                 options={{
                     minimap: { enabled: false },
                     fontSize: 14,
@@ -7,6 +7,34 @@ interface FileSystemAPI {
     saveFile: (path: string, content: string) => Promise<{ success?: boolean; error?: string }>
 }
 
+interface KernelVariable {
+    name: string
+    type: string
+    bytes?: number
+    shape?: number[]
+    dtype?: string
+    dtypes?: Record<string, number>
+    columns?: string[]
+    length?: number
+    preview?: string
+}
+
+interface KernelEvent {
+    id?: number | null  // null for output written while no cell is running
+    event: 'stream' | 'result' | 'error' | 'done' | 'variables' | 'exit'
+    name?: 'stdout' | 'stderr'
+    text?: string
+    repr?: string
+    ename?: string
+    evalue?: string
+    traceback?: string
+    status?: 'ok' | 'error' | 'interrupted' | 'dead'
+    seconds?: number | null
+    execution_count?: number
+    variables?: KernelVariable[]
+    memory?: { process_bytes: number | null }
+}
+
 interface Window {
     fileSystem: FileSystemAPI
     terminal: {
@@ -14,6 +42,13 @@ interface Window {
         send: (data: string) => void
         onData: (callback: (data: string) => void) => () => void
     }
+    kernel: {
+        execute: (code: string) => Promise<KernelEvent>
+        variables: (deep?: boolean) => Promise<KernelEvent>
+        interrupt: () => void
+        restart: () => Promise<{ success: boolean }>
+        onEvent: (callback: (event: KernelEvent) => void) => () => void
+    }
     appControl: {
         setMode: (mode: 'local' | 'colab') => void
     }
@@ -21,8 +56,15 @@ interface Window {
         search: (query: string) => Promise<any>
         download: (id: string, path: string) => Promise<any>
     }
+    datasets: {
+        index: (path: string) => Promise<any>
+        rows: (path: string, start: number, count: number, columns?: string[]) => Promise<any>
+        scan: (path: string, column: string, op: string, value: string, startRow?: number, limit?: number) => Promise<any>
+    }
     analysis: {
         recommend: (path: string) => Promise<any>
-        checkDeps: (path: string) => Promise<{ missing?: string[], error?: string }>
+        generateLoader: (path: string) => Promise<any>
+        checkDeps: (path: string) => Promise<{ missing?: string[], installCommand?: string, error?: string }>
+        checkProjectDeps: (dirPath: string) => Promise<any>
     }
 }
@@ -71,6 +71,30 @@ if (!isElectron) {
         }
     };
 
+    // Mock Kernel API
+    let kernelCallback: ((event: any) => void) | null = null;
+    let kernelCount = 0;
+    (window as any).kernel = {
+        execute: async (code: string) => {
+            const id = ++kernelCount;
+            console.log('[Mock] Kernel execute:', code.substring(0, 100));
+            kernelCallback?.({ id, event: 'stream', name: 'stdout', text: '[Mock kernel] cell executed\n' });
+            const done = { id, event: 'done', status: 'ok', execution_count: id, seconds: 0.001 };
+            kernelCallback?.(done);
+            return done;
+        },
+        variables: async () => ({ event: 'variables', variables: [], memory: { process_bytes: null } }),
+        interrupt: () => console.log('[Mock] Kernel interrupt'),
+        restart: async () => {
+            kernelCount = 0;
+            return { success: true };
+        },
+        onEvent: (callback: (event: any) => void) => {
+            kernelCallback = callback;
+            return () => { kernelCallback = null; };
+        }
+    };
+
     // Mock AppControl API
     (window as any).appControl = {
         setMode: (mode: string) => {
@@ -105,10 +129,31 @@ if (!isElectron) {
                 recommendation: 'Based on the data, we recommend using Random Forest or XGBoost for classification.'
             };
         },
+        generateLoader: async (path: string) => {
+            console.log('[Mock] Generating loader for:', path);
+            return {
+                success: true,
+                snippet: `import pandas as pd\n\ndf = pd.read_csv(${JSON.stringify(path)})\n`,
+                memory: { baseline_projected_bytes: 0, projected_bytes: 0 }
+            };
+        },
         checkDeps: async (path: string) => {
             console.log('[Mock] Checking deps for:', path);
             // Simulate finding sklearn as missing
             return { missing: ['scikit-learn'] };
+        },
+        checkProjectDeps: async (dirPath: string) => {
+            console.log('[Mock] Checking project deps for:', dirPath);
+            return {
+                success: true,
+                root: dirPath,
+                files: 1,
+                parsed: 1,
+                modules: { sklearn: { kind: 'missing', package: 'scikit-learn', importers: ['main.py'] } },
+                missing: ['scikit-learn'],
+                graph: { 'main.py': ['sklearn'] },
+                errors: {}
+            };
         }
     };
 
@@ -0,0 +1,202 @@
+"""
+Streaming output checker for Codeforces IDE.
+
+Compares a program's stdout (read from stdin while the program runs) with an
+expected-output file token by token. Both sides are read in fixed-size chunks
+and walked in lockstep, so memory stays bounded however large the outputs are.
+Tokens must match exactly, except that YES/NO answers ignore case and, when an
+epsilon is given, numbers may differ by an absolute or relative error.
+Prints one JSON verdict giving the line and column of the first difference.
+
+Usage:
+    python solution.py < input.txt | python checker.py expected.txt [--abs-eps 1e-6] [--rel-eps 1e-6]
+"""
+import sys
+import re
+import json
+import math
+import hashlib
+import argparse
+from itertools import islice
+
+CHUNK_SIZE = 64 * 1024
+MAX_TOKEN_BYTES = 1 << 20  # Longer tokens are compared by length and hash
+PREVIEW_BYTES = 80
+TOKEN = re.compile(rb"\S+")
+WHITESPACE = (b" ", b"\n", b"\t", b"\r", b"\x0b", b"\x0c")  # What bytes.split() and \S agree on
+NUMBER = re.compile(rb"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+YES_NO = {b"yes", b"no"}
+
+
+class Token:
+    """One whitespace-separated token and where it starts (1-based, columns in bytes)."""
+    __slots__ = ("value", "line", "column", "length", "digest")
+
+    def __init__(self, value, line, column, length=None, digest=None):
+        self.value = value  # Only the first MAX_TOKEN_BYTES of a long token
+        self.line = line
+        self.column = column
+        self.length = len(value) if length is None else length
+        self.digest = digest
+
+    def describe(self):
+        text = self.value[:PREVIEW_BYTES].decode("utf-8", errors="replace")
+        if self.length > PREVIEW_BYTES:
+            text += f"... ({self.length} bytes)"
+        return {"token": text, "line": self.line, "column": self.column}
+
+
+class Batch:
+    """
+    The tokens of one chunk as plain bytes (or a Token for an oversized one),
+    plus what is needed to work out where any of them starts.
+    """
+    __slots__ = ("values", "buf", "base", "line", "line_start")
+
+    def __init__(self, values, buf, base, line, line_start):
+        self.values = values
+        self.buf = buf
+        self.base = base  # Absolute offset of buf[0]
+        self.line = line  # Line number and absolute offset of that line's start, at buf[0]
+        self.line_start = line_start
+
+    def locate(self, index) -> Token:
+        value = self.values[index]
+        if isinstance(value, Token):
+            return value
+        match = next(islice(TOKEN.finditer(self.buf), index, None))
+        start = match.start()
+        line, line_start = self.line, self.line_start
+        newlines = self.buf.count(b"\n", 0, start)
+        if newlines:
+            line += newlines
+            line_start = self.base + self.buf.rfind(b"\n", 0, start) + 1
+        return Token(value, line, self.base + start - line_start + 1)
+
+
+def batches(stream, chunk_size=CHUNK_SIZE):
+    """Yields a Batch of tokens for every chunk read from a binary stream."""
+    line, line_start = 1, 0
+    base = 0
+    carry = b""  # The start of a token that may continue in the next chunk
+    long_token = None  # [hash, prefix, length, line, column] while inside an oversized token
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if long_token is not None:
+            end = min((i for i in (chunk.find(c) for c in WHITESPACE) if i >= 0), default=len(chunk))
+            long_token[0].update(chunk[:end])
+            long_token[2] += end
+            base += end
+            if chunk and end == len(chunk):
+                continue  # Still inside the token
+            chunk = chunk[end:]
+            digest, prefix, length, token_line, column = long_token
+            yield Batch([Token(prefix, token_line, column, length, digest.hexdigest())], b"", base, line, line_start)
+            long_token = None
+
+        buf = carry + chunk
+        if chunk:
+            last_space = max(chunk.rfind(c) for c in WHITESPACE)
+            consumed = len(carry) + last_space + 1 if last_space >= 0 else 0
+        else:
+            consumed = len(buf)
+        if consumed:
+            done = buf[:consumed]
+            values = done.split()
+            if values:
+                yield Batch(values, done, base, line, line_start)
+            newlines = done.count(b"\n")
+            if newlines:
+                line += newlines
+                line_start = base + done.rfind(b"\n") + 1
+            base += consumed
+        carry = buf[consumed:]
+        if not chunk:
+            return
+
+        if len(carry) > MAX_TOKEN_BYTES:
+            long_token = [hashlib.sha1(carry), carry[:MAX_TOKEN_BYTES], len(carry), line, base - line_start + 1]
+            base += len(carry)
+            carry = b""
+
+
+def _fingerprint(value):
+    if isinstance(value, Token):
+        return value.length, value.digest
+    return len(value), hashlib.sha1(value).hexdigest()
+
+
+def tokens_match(expected, actual, abs_eps: float = 0.0, rel_eps: float = 0.0) -> bool:
+    """Compares two token values: bytes, or Tokens for oversized ones."""
+    if isinstance(expected, Token) or isinstance(actual, Token):
+        # Only tokens that outgrew a buffer are hashed, which depends on where chunks fall
+        return _fingerprint(expected) == _fingerprint(actual)
+    if expected == actual:
+        return True
+    lowered = expected.lower()
+    if lowered in YES_NO and lowered == actual.lower():
+        return True
+    if (abs_eps or rel_eps) and NUMBER.fullmatch(expected) and NUMBER.fullmatch(actual):
+        e, a = float(expected), float(actual)
+        if math.isinf(e) or math.isinf(a):
+            return e == a
+        error = abs(a - e)
+        return error <= abs_eps or error <= rel_eps * abs(e)
+    return False
+
+
+def check(expected_stream, actual_stream, abs_eps: float = 0.0, rel_eps: float = 0.0) -> dict:
+    """
+    Compares two binary streams token by token and stops at the first
+    difference. Identical runs of tokens are compared a whole slice at a time;
+    only slices that differ are walked token by token.
+    """
+    expected_batches, actual_batches = batches(expected_stream), batches(actual_stream)
+    expected, actual = next(expected_batches, None), next(actual_batches, None)
+    i = j = count = 0
+    while expected is not None and actual is not None:
+        n = min(len(expected.values) - i, len(actual.values) - j)
+        e_values, a_values = expected.values[i:i + n], actual.values[j:j + n]
+        if e_values != a_values:
+            for k, (e, a) in enumerate(zip(e_values, a_values)):
+                if e != a and not tokens_match(e, a, abs_eps, rel_eps):
+                    return {"verdict": "WA", "reason": "Token mismatch", "token_index": count + k + 1,
+                            "expected": expected.locate(i + k).describe(),
+                            "actual": actual.locate(j + k).describe()}
+        count, i, j = count + n, i + n, j + n
+        if i == len(expected.values):
+            expected, i = next(expected_batches, None), 0
+        if j == len(actual.values):
+            actual, j = next(actual_batches, None), 0
+
+    if actual is not None:
+        return {"verdict": "WA", "reason": "Extra output", "token_index": count + 1,
+                "actual": actual.locate(j).describe()}
+    if expected is not None:
+        return {"verdict": "WA", "reason": "Output ended early", "token_index": count + 1,
+                "expected": expected.locate(i).describe()}
+    return {"verdict": "AC", "tokens": count}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare program output on stdin with an expected-output file.")
+    parser.add_argument("expected", help="Expected output file")
+    parser.add_argument("--abs-eps", type=float, default=0.0, help="Allowed absolute error for numbers")
+    parser.add_argument("--rel-eps", type=float, default=0.0, help="Allowed relative error for numbers")
+    args = parser.parse_args(argv)
+
+    try:
+        with open(args.expected, "rb") as expected:
+            result = check(expected, sys.stdin.buffer, args.abs_eps, args.rel_eps)
+    except Exception as e:
+        result = {"verdict": "ERROR", "error": str(e)}
+    print(json.dumps(result), flush=True)
+    # Keep reading so the program writing to us never sees a broken pipe
+    while sys.stdin.buffer.read(CHUNK_SIZE):
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@ const { app, BrowserWindow, ipcMain, dialog } = require('electron');
 const path = require('path');
 const fs = require('fs');
 const { spawn } = require('child_process');
+const { StringDecoder } = require('string_decoder');
 
 // Get the correct base path (works in dev and packaged)
 function getBasePath() {
@@ -139,8 +140,43 @@ ipcMain.handle('save-snippets', async (event, snippets) => {
 
 // Python execution
 let currentProcess = null;
+const MAX_DISPLAY_OUTPUT = 1024 * 1024;  // Only the first 1 MB of output is sent to the UI
+const OUTPUT_LIMIT = 64 * 1024 * 1024;   // The program is killed past this much output
 
-ipcMain.handle('run-python', async (event, { code, input }) => {
+// checker.py ships as an extra resource, next to the app rather than inside it
+function getCheckerPath() {
+    if (app.isPackaged) {
+        return path.join(process.resourcesPath, 'checker.py');
+    }
+    return path.join(__dirname, 'checker.py');
+}
+
+// Starts checker.py against the expected output; the program's stdout is piped into it
+function startChecker(expectedFile, { absEps, relEps } = {}) {
+    const args = [getCheckerPath(), expectedFile];
+    if (absEps) args.push('--abs-eps', String(absEps));
+    if (relEps) args.push('--rel-eps', String(relEps));
+
+    const checker = spawn('python', args, { cwd: getBasePath() });
+    let report = '';
+    checker.stdin.on('error', () => {});  // The checker may stop reading once it has a verdict
+    checker.stdout.on('data', (data) => {
+        report += data.toString();
+    });
+    checker.done = new Promise((resolve) => {
+        checker.on('close', () => {
+            try {
+                resolve(JSON.parse(report));
+            } catch (e) {
+                resolve({ verdict: 'ERROR', error: 'Checker produced no verdict' });
+            }
+        });
+        checker.on('error', (err) => resolve({ verdict: 'ERROR', error: `Failed to run checker: ${err.message}` }));
+    });
+    return checker;
+}
+
+ipcMain.handle('run-python', async (event, { code, input, expected, absEps, relEps }) => {
     return new Promise((resolve) => {
         // Kill previous process if running
         if (currentProcess) {
@@ -148,47 +184,93 @@ ipcMain.handle('run-python', async (event, { code, input }) => {
         }
 
         const tempFile = path.join(getBasePath(), '_temp_run.py');
+        const expectedFile = path.join(getBasePath(), '_temp_expected.txt');
         fs.writeFileSync(tempFile, code);
 
+        let checker = null;
+        if (expected && expected.trim()) {
+            fs.writeFileSync(expectedFile, expected);
+            checker = startChecker(expectedFile, { absEps, relEps });
+        }
+
+        // Output is decoded for display only up to MAX_DISPLAY_OUTPUT; the checker sees all of it
+        const decoder = new StringDecoder('utf8');
         let output = '';
+        let outputBytes = 0;
         let error = '';
+        let limitError = null;
+        let finished = false;
         const startTime = Date.now();
 
-        currentProcess = spawn('python', [tempFile], {
+        const proc = spawn('python', [tempFile], {
             cwd: getBasePath()
         });
+        currentProcess = proc;
+        if (checker) {
+            checker.on('close', () => proc.stdout.resume());  // Never leave the program blocked on a dead checker
+        }
+
+        const finish = async (result) => {
+            if (finished) return;
+            finished = true;
+            if (currentProcess === proc) currentProcess = null;
+            if (checker) {
+                checker.stdin.end();
+                // A run that did not finish normally has no meaningful verdict
+                if (result.exitCode === 0 && !limitError) {
+                    result.verdict = await checker.done;
+                } else {
+                    checker.kill();
+                }
+            }
+            // Clean up temp files
+            try { fs.unlinkSync(tempFile); } catch (e) {}
+            try { fs.unlinkSync(expectedFile); } catch (e) {}
+            if (outputBytes > MAX_DISPLAY_OUTPUT) {
+                result.truncated = true;
+                result.outputBytes = outputBytes;
+            }
+            resolve(result);
+        };
 
         // Send input if provided
         if (input) {
-            currentProcess.stdin.write(input);
-            currentProcess.stdin.end();
+            proc.stdin.write(input);
+            proc.stdin.end();
         }
 
-        currentProcess.stdout.on('data', (data) => {
-            output += data.toString();
+        proc.stdout.on('data', (data) => {
+            if (outputBytes < MAX_DISPLAY_OUTPUT) {
+                output += decoder.write(data.subarray(0, MAX_DISPLAY_OUTPUT - outputBytes));
+            }
+            outputBytes += data.length;
+            if (outputBytes > OUTPUT_LIMIT && !limitError) {
+                limitError = `Output Limit Exceeded (${OUTPUT_LIMIT / (1024 * 1024)} MB)`;
+                proc.kill();
+                return;
+            }
+            // Let the program wait for the checker rather than buffering its output here
+            if (checker && !checker.stdin.destroyed && !checker.stdin.write(data)) {
+                proc.stdout.pause();
+                checker.stdin.once('drain', () => proc.stdout.resume());
+            }
         });
 
-        currentProcess.stderr.on('data', (data) => {
+        proc.stderr.on('data', (data) => {
             error += data.toString();
         });
 
-        currentProcess.on('close', (code) => {
-            const executionTime = Date.now() - startTime;
-            // Clean up temp file
-            try { fs.unlinkSync(tempFile); } catch (e) {}
-            
-            currentProcess = null;
-            resolve({
+        proc.on('close', (code) => {
+            finish({
                 output: output.trim(),
-                error: error.trim(),
-                exitCode: code,
-                executionTime
+                error: limitError || error.trim(),
+                exitCode: limitError ? -1 : code,
+                executionTime: Date.now() - startTime
             });
         });
 
-        currentProcess.on('error', (err) => {
-            currentProcess = null;
-            resolve({
+        proc.on('error', (err) => {
+            finish({
                 output: '',
                 error: `Failed to run Python: ${err.message}`,
                 exitCode: -1,
@@ -198,10 +280,9 @@ ipcMain.handle('run-python', async (event, { code, input }) => {
 
         // Timeout after 10 seconds
         setTimeout(() => {
-            if (currentProcess) {
-                currentProcess.kill();
-                currentProcess = null;
-                resolve({
+            if (!finished) {
+                proc.kill();
+                finish({
                     output: output.trim(),
                     error: 'Time Limit Exceeded (10s)',
                     exitCode: -1,
@@ -15,7 +15,8 @@ contextBridge.exposeInMainWorld('electronAPI', {
     saveSnippets: (snippets) => ipcRenderer.invoke('save-snippets', snippets),
 
     // Python execution
-    runPython: (code, input) => ipcRenderer.invoke('run-python', { code, input }),
+    // options: { expected, absEps, relEps } to check the output against an expected answer
+    runPython: (code, input, options = {}) => ipcRenderer.invoke('run-python', { code, input, ...options }),
     stopPython: () => ipcRenderer.send('stop-python'),
 
     // App info
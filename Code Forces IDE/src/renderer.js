@@ -78,6 +78,8 @@ const elements = {
     outputArea: document.getElementById('outputArea'),
     execTime: document.getElementById('execTime'),
     verdict: document.getElementById('verdict'),
+    expectedArea: document.getElementById('expectedArea'),
+    epsInput: document.getElementById('epsInput'),
     clearInputBtn: document.getElementById('clearInputBtn'),
 
     // Variable Manager
@@ -788,6 +790,8 @@ function parseVariables(code) {
 
         const code = editor.getValue();
         const input = elements.inputArea.value;
+        const expected = elements.expectedArea.value;
+        const eps = parseFloat(elements.epsInput.value) || 0;
 
         elements.outputArea.textContent = 'Running...';
         elements.outputArea.classList.remove('error');
@@ -798,20 +802,23 @@ function parseVariables(code) {
         elements.stopBtn.disabled = false;
 
         try {
-            const result = await window.electronAPI.runPython(code, input);
+            const result = await window.electronAPI.runPython(code, input, { expected, absEps: eps, relEps: eps });
 
             if (result.error && !result.output) {
                 elements.outputArea.textContent = result.error;
                 elements.outputArea.classList.add('error');
             } else {
                 elements.outputArea.textContent = result.output || '(no output)';
+                if (result.truncated) {
+                    elements.outputArea.textContent += `\n... output truncated (${(result.outputBytes / (1024 * 1024)).toFixed(1)} MB total)`;
+                }
                 if (result.error) {
                     elements.outputArea.textContent += '\n\n--- STDERR ---\n' + result.error;
                 }
             }
 
             elements.execTime.textContent = `${result.executionTime}ms`;
-            checkVerdict(result.output);
+            checkVerdict(result);
 
         } catch (error) {
             elements.outputArea.textContent = 'Error: ' + error.message;
@@ -829,21 +836,27 @@ function parseVariables(code) {
         elements.stopBtn.disabled = true;
     }
 
-    function checkVerdict(output) {
-        const expected = elements.expectedArea.value.trim();
-        if (!expected) {
+    // The verdict comes from checker.py, which compares the whole output token by token
+    function checkVerdict(result) {
+        const verdict = result.verdict;
+        if (!verdict) {
+            elements.verdict.textContent = '';
             elements.verdict.className = 'verdict';
             return;
         }
 
-        const actual = (output || '').trim();
-        const normalizeOutput = (s) => s.split(/\s+/).filter(x => x).join(' ');
-
-        if (normalizeOutput(actual) === normalizeOutput(expected)) {
-            elements.verdict.textContent = '✅ Accepted';
+        if (verdict.verdict === 'AC') {
+            elements.verdict.textContent = `✅ Accepted (${verdict.tokens} tokens)`;
             elements.verdict.className = 'verdict ac';
+        } else if (verdict.verdict === 'WA') {
+            const where = verdict.actual || verdict.expected;
+            let text = `❌ Wrong Answer: ${verdict.reason} at line ${where.line}, column ${where.column}`;
+            if (verdict.expected) text += `\n  expected: ${verdict.expected.token}`;
+            if (verdict.actual) text += `\n  found:    ${verdict.actual.token}`;
+            elements.verdict.textContent = text;
+            elements.verdict.className = 'verdict wa';
         } else {
-            elements.verdict.textContent = '❌ Wrong Answer';
+            elements.verdict.textContent = `Checker error: ${verdict.error}`;
             elements.verdict.className = 'verdict wa';
         }
     }
@@ -146,6 +146,11 @@ sys.stdout = _captured_output
 sys.stderr = _captured_output
         `);
 
+        // Load the variable inspector once; it is reused after every run
+        const inspectorSource = await (await fetch('var_inspector.py')).text();
+        pyodide.FS.writeFile('var_inspector.py', inspectorSource);
+        await pyodide.runPythonAsync('import var_inspector as _var_inspector');
+
         elements.loadingProgress.style.width = '100%';
         elements.loadingStatus.textContent = 'Ready!';
 
@@ -355,28 +360,30 @@ async function updateVariables() {
 
     // Render variables with values and actions
     elements.variablesPanel.innerHTML = vars.map(v => {
-        const value = variableValues[v.name];
-        const valueDisplay = value !== undefined ? `<span class="var-value" title="${escapeHtml(String(value))}">${truncateValue(value)}</span>` : '';
+        const info = variableValues[v.name];
+        const valueDisplay = info !== undefined ? `<span class="var-value" title="${escapeHtml(describeValue(info))}">${truncateValue(info.preview)}</span>` : '';
+        // Prefer the runtime type over the guess from parsing the source
+        const type = info !== undefined ? info.type : v.type;
 
         // Determine which buttons to show based on type
         let actionButtons = `<button class="var-action" onclick="insertCode('print(${v.name})')" title="Print">📋</button>`;
 
         // Add len() button for lists, strings, dicts
-        if (['list', 'str', 'dict'].includes(v.type)) {
+        if (['list', 'str', 'dict'].includes(type)) {
             actionButtons += `<button class="var-action" onclick="insertCode('print(len(${v.name}))')" title="Print Length">📏</button>`;
         }
 
         // Add iterate button for lists
-        if (v.type === 'list') {
+        if (type === 'list') {
             actionButtons += `<button class="var-action" onclick="insertCode('for item in ${v.name}:\\\\n    print(item)')" title="Iterate">🔄</button>`;
         }
 
         return `
         <div class="var-item">
-            <div class="var-icon">${getTypeIcon(v.type)}</div>
+            <div class="var-icon">${getTypeIcon(type)}</div>
             <span class="var-name">${v.name}</span>
             ${valueDisplay}
-            <span class="var-type">${v.type}</span>
+            <span class="var-type">${type}</span>
             <div class="var-actions">
                 ${actionButtons}
             </div>
@@ -385,30 +392,22 @@ async function updateVariables() {
     }).join('');
 }
 
-// Fetch variable values after code execution
+// Fetch variable values after code execution (single round trip)
 async function fetchVariableValues() {
     if (!pyodide) return;
 
     const code = editor.getValue();
-    const vars = parseVariables(code);
+    const names = parseVariables(code).map(v => v.name);
     variableValues = {};
 
-    for (const v of vars) {
+    if (names.length > 0) {
         try {
-            const result = await pyodide.runPythonAsync(`
-try:
-    _val = ${v.name}
-    if isinstance(_val, (list, dict, set)):
-        _result = str(type(_val).__name__) + '[' + str(len(_val)) + ']'
-    else:
-        _result = repr(_val)[:50]
-except:
-    _result = '?'
-_result
-            `);
-            variableValues[v.name] = result;
+            const snapshot = await pyodide.runPythonAsync(
+                `_var_inspector.snapshot(globals(), ${JSON.stringify(names)})`
+            );
+            variableValues = JSON.parse(snapshot);
         } catch (e) {
-            variableValues[v.name] = '?';
+            console.error('Variable snapshot failed:', e);
         }
     }
 
@@ -450,6 +449,14 @@ function getTypeIcon(type) {
     return icons[type] || '?';
 }
 
+function describeValue(info) {
+    let meta = info.type;
+    if (info.shape) meta += ` shape=(${info.shape.join(', ')})`;
+    else if (info.size !== undefined) meta += `[${info.size}]`;
+    if (info.dtype) meta += ` ${info.dtype}`;
+    return `${meta}\n${info.preview}`;
+}
+
 function truncateValue(val) {
     const str = String(val);
     return str.length > 12 ? str.substring(0, 10) + '...' : str;
@@ -0,0 +1,80 @@
+"""
+Variable inspector for the Codeforces IDE web runner.
+Loaded once into Pyodide and called after every run to snapshot the
+user's globals in a single round trip.
+"""
+import json
+import reprlib
+
+PREVIEW_CHARS = 50
+
+# reprlib stops walking containers after a few items, so previews of huge
+# lists/dicts are built without materialising their full repr.
+_repr = reprlib.Repr()
+_repr.maxlevel = 2
+_repr.maxlist = _repr.maxtuple = _repr.maxset = _repr.maxfrozenset = 8
+_repr.maxdeque = 8
+_repr.maxdict = 6
+_repr.maxstring = PREVIEW_CHARS
+_repr.maxlong = 40
+_repr.maxother = PREVIEW_CHARS
+
+_SIZED_TYPES = (list, tuple, dict, set, frozenset, str, bytes)
+
+
+def _numpy_info(value):
+    """Returns shape/dtype metadata for NumPy arrays without importing NumPy."""
+    if type(value).__module__ != 'numpy' or not hasattr(value, 'shape'):
+        return None
+    return {
+        "shape": list(value.shape),
+        "dtype": str(value.dtype),
+        "size": int(value.size),
+        "nbytes": int(value.nbytes),
+    }
+
+
+def _preview(value, array_info):
+    if array_info is not None:
+        flat = value.ravel()[:8].tolist() if value.ndim else [value.item()]
+        text = _repr.repr(flat)
+        if array_info["size"] > len(flat):
+            text = text[:-1] + ', ...]'
+        return f"array({text})"[:PREVIEW_CHARS]
+    try:
+        return _repr.repr(value)[:PREVIEW_CHARS]
+    except Exception:
+        return '?'
+
+
+def describe(value):
+    """Builds a bounded description of a single value."""
+    array_info = _numpy_info(value)
+    info = {
+        "type": type(value).__name__,
+        "preview": _preview(value, array_info),
+    }
+    if array_info is not None:
+        info.update(array_info)
+    elif isinstance(value, _SIZED_TYPES):
+        info["size"] = len(value)
+    elif hasattr(value, 'shape') and isinstance(getattr(value, 'shape'), tuple):
+        # pandas objects and other array-likes
+        info["shape"] = list(value.shape)
+    return info
+
+
+def snapshot(namespace, names):
+    """
+    Describes every requested name found in `namespace` and returns the
+    result as a JSON string so the JS side needs only one call.
+    """
+    result = {}
+    for name in names:
+        if name not in namespace:
+            continue
+        try:
+            result[name] = describe(namespace[name])
+        except Exception:
+            result[name] = {"type": "?", "preview": '?'}
+    return json.dumps(result)
@@ -1,9 +1,16 @@
 import ast
-import subprocess
-import sys
 import importlib.util
+from wheelhouse import Wheelhouse
 
 class AutoInstaller:
+    _wheelhouse = None
+
+    @staticmethod
+    def wheelhouse():
+        if AutoInstaller._wheelhouse is None:
+            AutoInstaller._wheelhouse = Wheelhouse()
+        return AutoInstaller._wheelhouse
+
     @staticmethod
     def install_missing_modules(code):
         """
@@ -14,12 +21,11 @@ class AutoInstaller:
             for module_name in modules:
                 if not AutoInstaller._is_module_installed(module_name):
                     print(f"[AutoInstall] Module '{module_name}' not found. Attempting to install...")
-                    try:
-                        # Run pip to install the module
-                        subprocess.check_call([sys.executable, "-m", "pip", "install", module_name])
+                    # Served from the local wheelhouse; only new packages hit the index
+                    if AutoInstaller.wheelhouse().install([module_name]):
                         print(f"[AutoInstall] Successfully installed '{module_name}'.")
-                    except subprocess.CalledProcessError as e:
-                        print(f"[AutoInstall] Failed to install '{module_name}': {e}")
+                    else:
+                        print(f"[AutoInstall] Failed to install '{module_name}'.")
         except Exception as e:
             print(f"Auto-install scan failed: {e}")
 
@@ -1,6 +1,6 @@
 # background_saver.py
 
-from PyQt5.QtCore import QThread, pyqtSignal, QObject
+from PyQt6.QtCore import QThread, pyqtSignal, QObject
 
 
 class BackgroundSaver(QObject):
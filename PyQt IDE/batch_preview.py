@@ -0,0 +1,196 @@
+# batch_preview.py
+"""
+Headless batch renderer for PyQt6 preview projects.
+
+Renders every project offscreen to a PNG using the same sanitizing importer
+and widget discovery as the live preview, then writes a JSON report with
+per-project timings, errors and image hashes. Projects whose sources have not
+changed since the last run are skipped using the cached result.
+
+Usage:
+    python batch_preview.py projects/ other_project/ --out preview_out --jobs 4
+"""
+
+import os
+
+# Must be set before the QApplication is created in each worker
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import hashlib
+import importlib
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+CACHE_FILE = "cache.json"
+REPORT_FILE = "report.json"
+MAIN_MODULE_NAMES = ("main", "app")
+
+_app = None
+
+
+def load_project(project_dir):
+    """Reads every top-level .py file of a project into a module-name -> source dict."""
+    code_dict = {}
+    for name in sorted(os.listdir(project_dir)):
+        path = os.path.join(project_dir, name)
+        if name.endswith(".py") and os.path.isfile(path):
+            with open(path, "r", encoding="utf-8") as f:
+                code_dict[os.path.splitext(name)[0]] = f.read()
+    return code_dict
+
+
+def project_fingerprint(code_dict):
+    digest = hashlib.sha256()
+    for module_name in sorted(code_dict):
+        digest.update(module_name.encode("utf-8") + b"\0")
+        digest.update(code_dict[module_name].encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def output_name(project_dir):
+    """A stable, collision-free PNG name for a project directory."""
+    abs_path = os.path.abspath(project_dir)
+    short_hash = hashlib.sha1(abs_path.encode("utf-8")).hexdigest()[:8]
+    return f"{os.path.basename(abs_path) or 'project'}-{short_hash}.png"
+
+
+def _init_worker():
+    global _app
+    from PyQt6.QtWidgets import QApplication
+    _app = QApplication.instance() or QApplication([])
+
+
+def render_project(project_dir, out_dir):
+    """Imports a project in memory, renders its widget offscreen and saves a PNG."""
+    from preview_runner import InMemoryImporter, PreviewRunner, find_widget_class
+
+    if _app is None:
+        _init_worker()
+
+    result = {"project": os.path.abspath(project_dir), "success": False}
+    started = time.perf_counter()
+    code_dict = load_project(project_dir)
+    result["fingerprint"] = project_fingerprint(code_dict)
+    main_module_name = next((n for n in MAIN_MODULE_NAMES if n in code_dict), None)
+    if main_module_name is None:
+        result["error"] = "No 'main.py' or 'app.py' found."
+        return result
+
+    importer = InMemoryImporter(code_dict)
+    # Workers are reused, so modules from the previous project must not stay importable
+    PreviewRunner._release_modules(InMemoryImporter.take_modules(code_dict))
+    sys.meta_path.insert(0, importer)
+    widget = None
+    try:
+        main_module = importlib.import_module(main_module_name)
+        imported = time.perf_counter()
+        result["import_seconds"] = round(imported - started, 4)
+
+        widget_class = find_widget_class(main_module.__dict__)
+        if widget_class is None:
+            result["error"] = "No QWidget or QMainWindow subclass found."
+            return result
+
+        widget = widget_class()
+        widget.show()
+        _app.processEvents()
+        image = widget.grab().toImage()
+        result["render_seconds"] = round(time.perf_counter() - imported, 4)
+
+        png_path = os.path.join(out_dir, output_name(project_dir))
+        if not image.save(png_path, "PNG"):
+            result["error"] = f"Could not write {png_path}"
+            return result
+        bits = image.constBits()
+        bits.setsize(image.sizeInBytes())
+        result.update({
+            "success": True,
+            "image": png_path,
+            "image_hash": hashlib.sha256(bytes(bits)).hexdigest(),
+            "size": [image.width(), image.height()],
+        })
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if importer in sys.meta_path:
+            sys.meta_path.remove(importer)
+        if widget is not None:
+            widget.close()
+            widget.deleteLater()
+            _app.processEvents()
+        result["total_seconds"] = round(time.perf_counter() - started, 4)
+    return result
+
+
+def _load_cache(out_dir):
+    try:
+        with open(os.path.join(out_dir, CACHE_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _is_cached(entry, fingerprint):
+    if not entry or entry.get("fingerprint") != fingerprint:
+        return False
+    # A cached success is only valid while its image still exists
+    return not entry.get("success") or os.path.exists(entry.get("image", ""))
+
+
+def run_batch(project_dirs, out_dir, jobs=None, force=False):
+    """Renders all projects in a process pool and returns the list of results."""
+    os.makedirs(out_dir, exist_ok=True)
+    cache = {} if force else _load_cache(out_dir)
+    results = {}
+    pending = []
+    for project_dir in project_dirs:
+        key = os.path.abspath(project_dir)
+        entry = cache.get(key)
+        if _is_cached(entry, project_fingerprint(load_project(project_dir))):
+            results[key] = dict(entry, cached=True)
+        else:
+            pending.append(project_dir)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+            futures = {pool.submit(render_project, p, out_dir): p for p in pending}
+            for future in as_completed(futures):
+                project_dir = futures[future]
+                key = os.path.abspath(project_dir)
+                try:
+                    result = future.result()
+                except Exception as e:  # The worker process itself died
+                    result = {"project": key, "success": False, "error": f"Worker crashed: {e}"}
+                results[key] = dict(result, cached=False)
+                if "fingerprint" in result:
+                    cache[key] = result
+
+    with open(os.path.join(out_dir, CACHE_FILE), "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+    ordered = [results[os.path.abspath(p)] for p in project_dirs]
+    with open(os.path.join(out_dir, REPORT_FILE), "w", encoding="utf-8") as f:
+        json.dump(ordered, f, indent=2)
+    return ordered
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render PyQt6 preview projects offscreen to PNG.")
+    parser.add_argument("projects", nargs="+", help="Project directories containing main.py or app.py")
+    parser.add_argument("--out", default="preview_out", help="Output directory for PNGs and reports")
+    parser.add_argument("--jobs", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--force", action="store_true", help="Ignore cached results")
+    args = parser.parse_args(argv)
+
+    results = run_batch(args.projects, args.out, jobs=args.jobs, force=args.force)
+    for r in results:
+        status = "CACHED" if r.get("cached") else ("OK" if r["success"] else "FAIL")
+        detail = r.get("image_hash", "")[:12] if r["success"] else r.get("error", "")
+        print(f"[{status:6}] {r['project']} ({r.get('total_seconds', 0):.2f}s) {detail}")
+    return 0 if all(r["success"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
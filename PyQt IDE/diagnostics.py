@@ -0,0 +1,307 @@
+# diagnostics.py
+
+import ast
+import builtins
+import hashlib
+import symtable
+from collections import namedtuple
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+
+# line/column are 0-based, matching QScintilla's (line, index) positions
+Diagnostic = namedtuple("Diagnostic", ["line", "column", "end_column", "severity", "message"])
+
+ERROR = "error"
+WARNING = "warning"
+
+_BUILTIN_NAMES = set(dir(builtins)) | {
+    "__name__", "__file__", "__doc__", "__spec__", "__loader__",
+    "__package__", "__builtins__", "__annotations__", "__path__",
+}
+
+
+def content_hash(code):
+    return hashlib.sha1(code.encode("utf-8")).hexdigest()
+
+
+def check_syntax(code, filename="<editor>"):
+    """Returns the parsed tree and a list holding the syntax error, if any."""
+    try:
+        return ast.parse(code, filename), []
+    except SyntaxError as e:
+        line = max((e.lineno or 1) - 1, 0)
+        column = max((e.offset or 1) - 1, 0)
+        return None, [Diagnostic(line, column, column + 1, ERROR, f"SyntaxError: {e.msg}")]
+
+
+class _UndefinedNameVisitor(ast.NodeVisitor):
+    """
+    Walks the AST alongside the symtable scopes and reports loads of names
+    that resolve to neither a module-level binding nor a builtin.
+    """
+    _COMPREHENSIONS = {
+        ast.ListComp: "listcomp", ast.SetComp: "setcomp",
+        ast.DictComp: "dictcomp", ast.GeneratorExp: "genexpr",
+    }
+
+    def __init__(self, top_table, module_bound):
+        self.tables = [top_table]
+        self.extra_bound = [set()]
+        self.module_bound = module_bound
+        self.diagnostics = []
+
+    def _child_table(self, name, lineno):
+        for child in self.tables[-1].get_children():
+            if child.get_name() == name and child.get_lineno() == lineno:
+                return child
+        return None
+
+    def _enter(self, table, bound=()):
+        self.tables.append(table or self.tables[-1])
+        self.extra_bound.append(set(bound))
+
+    def _leave(self):
+        self.tables.pop()
+        self.extra_bound.pop()
+
+    def _is_undefined(self, name):
+        if name in _BUILTIN_NAMES or name in self.module_bound:
+            return False
+        if any(name in bound for bound in self.extra_bound):
+            return False
+        table = self.tables[-1]
+        try:
+            symbol = table.lookup(name)
+        except KeyError:
+            return False
+        if table.get_type() == "module":
+            return True
+        return symbol.is_global()
+
+    def visit_Name(self, node):
+        if isinstance(node.ctx, ast.Load) and self._is_undefined(node.id):
+            self.diagnostics.append(Diagnostic(
+                node.lineno - 1, node.col_offset, node.end_col_offset,
+                ERROR, f"Undefined name '{node.id}'"))
+
+    def _visit_function(self, node):
+        # Decorators, defaults and annotations are evaluated in the enclosing scope
+        decorators = getattr(node, "decorator_list", [])
+        for expr in decorators + node.args.defaults + node.args.kw_defaults:
+            if expr is not None:
+                self.visit(expr)
+        all_args = node.args.posonlyargs + node.args.args + node.args.kwonlyargs
+        all_args += [a for a in (node.args.vararg, node.args.kwarg) if a is not None]
+        for arg in all_args:
+            if arg.annotation is not None:
+                self.visit(arg.annotation)
+        if getattr(node, "returns", None) is not None:
+            self.visit(node.returns)
+
+        name = "lambda" if isinstance(node, ast.Lambda) else node.name
+        self._enter(self._child_table(name, node.lineno), (a.arg for a in all_args))
+        body = [node.body] if isinstance(node, ast.Lambda) else node.body
+        for stmt in body:
+            self.visit(stmt)
+        self._leave()
+
+    visit_FunctionDef = visit_AsyncFunctionDef = visit_Lambda = _visit_function
+
+    def visit_ClassDef(self, node):
+        for expr in node.decorator_list + node.bases + [k.value for k in node.keywords]:
+            self.visit(expr)
+        self._enter(self._child_table(node.name, node.lineno))
+        for stmt in node.body:
+            self.visit(stmt)
+        self._leave()
+
+    def _visit_comprehension(self, node):
+        generators = node.generators
+        # The first iterable is evaluated in the enclosing scope
+        self.visit(generators[0].iter)
+        targets = {n.id for g in generators for n in ast.walk(g.target) if isinstance(n, ast.Name)}
+        table = self._child_table(self._COMPREHENSIONS[type(node)], node.lineno)
+        self._enter(table, targets)
+        for i, generator in enumerate(generators):
+            if i:
+                self.visit(generator.iter)
+            for condition in generator.ifs:
+                self.visit(condition)
+        if isinstance(node, ast.DictComp):
+            self.visit(node.key)
+            self.visit(node.value)
+        else:
+            self.visit(node.elt)
+        self._leave()
+
+    visit_ListComp = visit_SetComp = visit_DictComp = visit_GeneratorExp = _visit_comprehension
+
+
+def _module_scope_walrus_targets(tree):
+    """Names bound by := in module-level code, including inside its comprehensions."""
+    names = set()
+    pending = [tree]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, ast.NamedExpr) and isinstance(node.target, ast.Name):
+            names.add(node.target.id)
+        # Function, lambda and class bodies bind in their own scope
+        body = getattr(node, "body", None) if isinstance(
+            node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)) else None
+        skipped = {id(n) for n in (body if isinstance(body, list) else [body])}
+        pending.extend(child for child in ast.iter_child_nodes(node) if id(child) not in skipped)
+    return names
+
+
+def _annotation_names(annotation):
+    """Names used by an annotation, including ones written as strings like 'List[int]'."""
+    names = set()
+    pending = [annotation]
+    while pending:
+        for node in ast.walk(pending.pop()):
+            if isinstance(node, ast.Name):
+                names.add(node.id)
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+                try:
+                    pending.append(ast.parse(node.value, mode="eval"))
+                except SyntaxError:
+                    pass  # An ordinary string such as a Literal value
+    return names
+
+
+def check_undefined_names(tree, code, filename="<editor>"):
+    """Reports names that are loaded but never bound anywhere they could resolve."""
+    if any(isinstance(node, ast.ImportFrom) and any(a.name == "*" for a in node.names)
+           for node in ast.walk(tree)):
+        return []  # Star imports make every name potentially defined
+    try:
+        top = symtable.symtable(code, filename, "exec")
+    except SyntaxError:
+        return []
+
+    module_bound = {s.get_name() for s in top.get_symbols()
+                    if s.is_assigned() or s.is_imported() or s.is_namespace()}
+    # Names declared `global` inside functions become module-level bindings
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Global):
+            module_bound.update(node.names)
+    # A := inside a module-level comprehension binds at module scope, which
+    # symtable only records as a free name of the comprehension
+    module_bound |= _module_scope_walrus_targets(tree)
+
+    visitor = _UndefinedNameVisitor(top, module_bound)
+    visitor.visit(tree)
+    return visitor.diagnostics
+
+
+def check_unused_imports(tree):
+    """Reports imported names that are never referenced in the module."""
+    used = set()
+    exported = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            used.add(node.id)
+        elif isinstance(node, (ast.arg, ast.AnnAssign)) and node.annotation is not None:
+            used |= _annotation_names(node.annotation)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.returns is not None:
+            used |= _annotation_names(node.returns)
+        elif isinstance(node, ast.Assign) and any(
+                isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets):
+            if isinstance(node.value, (ast.List, ast.Tuple)):
+                exported.update(e.value for e in node.value.elts
+                                if isinstance(e, ast.Constant) and isinstance(e.value, str))
+
+    diagnostics = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module == "__future__":
+            continue
+        if not isinstance(node, (ast.Import, ast.ImportFrom)):
+            continue
+        for alias in node.names:
+            if alias.name == "*":
+                continue
+            bound = alias.asname or alias.name.split(".")[0]
+            if bound not in used and bound not in exported:
+                diagnostics.append(Diagnostic(
+                    node.lineno - 1, node.col_offset, node.end_col_offset,
+                    WARNING, f"'{alias.name}' imported but unused"))
+    return diagnostics
+
+
+def run_checks(code, filename="<editor>"):
+    """Runs every check on a piece of source code and returns its diagnostics."""
+    tree, diagnostics = check_syntax(code, filename)
+    if tree is None:
+        return diagnostics
+    diagnostics += check_undefined_names(tree, code, filename)
+    diagnostics += check_unused_imports(tree)
+    return sorted(diagnostics)
+
+
+class _DiagnosticsWorker(QObject):
+    finished = pyqtSignal(str, str, list)
+
+    def __init__(self, latest_hashes):
+        super().__init__()
+        self.latest_hashes = latest_hashes
+
+    @pyqtSlot(str, str, str)
+    def check(self, file_path, code_hash, code):
+        # Skip work that was superseded by newer edits while it was queued
+        if self.latest_hashes.get(file_path) != code_hash:
+            return
+        self.finished.emit(file_path, code_hash, run_checks(code, file_path))
+
+
+class DiagnosticsService(QObject):
+    """
+    Runs syntax and static checks for open editor tabs on a worker thread.
+    Each file is only re-checked when the hash of its content changes.
+    """
+    diagnostics_ready = pyqtSignal(str, list)  # file_path, diagnostics
+    _check_requested = pyqtSignal(str, str, str)
+
+    def __init__(self, cache_size=256):
+        super().__init__()
+        self.cache_size = cache_size
+        self._latest_hashes = {}
+        self._results = {}  # content hash -> diagnostics
+
+        self.thread = QThread()
+        self._worker = _DiagnosticsWorker(self._latest_hashes)
+        self._worker.moveToThread(self.thread)
+        self._check_requested.connect(self._worker.check)
+        self._worker.finished.connect(self._on_finished)
+        self.thread.start()
+
+    def submit(self, file_path, code):
+        """Schedules a check of `code`; unchanged content is not re-checked."""
+        code_hash = content_hash(code)
+        if self._latest_hashes.get(file_path) == code_hash:
+            return
+        self._latest_hashes[file_path] = code_hash
+        if code_hash in self._results:
+            self.diagnostics_ready.emit(file_path, self._results[code_hash])
+        else:
+            self._check_requested.emit(file_path, code_hash, code)
+
+    def forget(self, file_path):
+        self._latest_hashes.pop(file_path, None)
+
+    def cached(self, code):
+        """Returns the worker's diagnostics for `code`, or None if it hasn't checked it yet."""
+        code_hash = content_hash(code)
+        diagnostics = self._results.pop(code_hash, None)
+        if diagnostics is not None:
+            self._results[code_hash] = diagnostics  # Keeps open tabs' results from being evicted
+        return diagnostics
+
+    def stop(self):
+        self.thread.quit()
+        self.thread.wait()
+
+    def _on_finished(self, file_path, code_hash, diagnostics):
+        if len(self._results) >= self.cache_size:
+            self._results.pop(next(iter(self._results)))
+        self._results[code_hash] = diagnostics
+        if self._latest_hashes.get(file_path) == code_hash:
+            self.diagnostics_ready.emit(file_path, diagnostics)
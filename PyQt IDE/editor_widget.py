@@ -1,13 +1,19 @@
-from PyQt5.QtGui import QColor, QFont
+from PyQt6.QtGui import QColor, QFont
 import os,sys
-from PyQt5.Qsci import QsciScintilla, QsciLexerPython
+from PyQt6.Qsci import QsciScintilla, QsciLexerPython
 
 class EditorWidget(QsciScintilla):
+    ERROR_INDICATOR = 8
+    WARNING_INDICATOR = 9
+    ERROR_MARKER = 0
+    WARNING_MARKER = 1
+
     def __init__(self):
         super().__init__()
         self.setUtf8(True)
         self.setLexer(QsciLexerPython())
         self._style_editor()
+        self._setup_diagnostics()
 
     def _style_editor(self):
         margin_bg_color = QColor("#252526")
@@ -38,4 +44,37 @@ class EditorWidget(QsciScintilla):
 
         self.setMarginType(1, QsciScintilla.MarginType.NumberMargin)
         self.setMarginWidth(1, "00000")
-        self.setMarginLineNumbers(1, True)
\ No newline at end of file
+        self.setMarginLineNumbers(1, True)
+
+    def _setup_diagnostics(self):
+        self.indicatorDefine(QsciScintilla.IndicatorStyle.SquiggleIndicator, self.ERROR_INDICATOR)
+        self.setIndicatorForegroundColor(QColor("#E53935"), self.ERROR_INDICATOR)
+        self.indicatorDefine(QsciScintilla.IndicatorStyle.SquiggleIndicator, self.WARNING_INDICATOR)
+        self.setIndicatorForegroundColor(QColor("#D7BA7D"), self.WARNING_INDICATOR)
+
+        self.markerDefine(QsciScintilla.MarkerSymbol.Circle, self.ERROR_MARKER)
+        self.setMarkerBackgroundColor(QColor("#E53935"), self.ERROR_MARKER)
+        self.markerDefine(QsciScintilla.MarkerSymbol.Circle, self.WARNING_MARKER)
+        self.setMarkerBackgroundColor(QColor("#D7BA7D"), self.WARNING_MARKER)
+
+        self.setMarginType(0, QsciScintilla.MarginType.SymbolMargin)
+        self.setMarginWidth(0, 14)
+        self.setMarginMarkerMask(0, (1 << self.ERROR_MARKER) | (1 << self.WARNING_MARKER))
+
+    def show_diagnostics(self, diagnostics):
+        """Renders diagnostics as squiggle indicators and margin markers."""
+        last_line = max(self.lines() - 1, 0)
+        for indicator in (self.ERROR_INDICATOR, self.WARNING_INDICATOR):
+            self.clearIndicatorRange(0, 0, last_line, len(self.text(last_line)), indicator)
+        self.markerDeleteAll(self.ERROR_MARKER)
+        self.markerDeleteAll(self.WARNING_MARKER)
+
+        for diagnostic in diagnostics:
+            if diagnostic.line > last_line:
+                continue
+            is_error = diagnostic.severity == "error"
+            indicator = self.ERROR_INDICATOR if is_error else self.WARNING_INDICATOR
+            end_column = max(diagnostic.end_column or 0, diagnostic.column + 1)
+            self.fillIndicatorRange(diagnostic.line, diagnostic.column,
+                                    diagnostic.line, end_column, indicator)
+            self.markerAdd(diagnostic.line, self.ERROR_MARKER if is_error else self.WARNING_MARKER)
@@ -1,29 +1,118 @@
 # file_manager.py
 
 import os
-from PyQt5.QtGui import QFileSystemModel
-from PyQt5.QtCore import QDir, QModelIndex
 import shutil
+from PyQt6.QtGui import QStandardItemModel, QStandardItem
+from PyQt6.QtWidgets import QFileIconProvider
+from PyQt6.QtCore import Qt, QModelIndex, QObject, QThread, pyqtSignal
+from project_tree import ProjectTreeWorker, load_snapshot
+
+PATH_ROLE = Qt.ItemDataRole.UserRole + 1
+IS_DIR_ROLE = Qt.ItemDataRole.UserRole + 2
+
+
+class FileManager(QObject):
+    """
+    Drives the file explorer. The tree is shown immediately from the project's
+    cached snapshot, then a background worker re-lists only the directories
+    that changed, skipping ignored folders such as venv/ and node_modules/.
+    """
+    _refresh_requested = pyqtSignal(str, object)
 
-class FileManager:
     def __init__(self, tree_view):
+        super().__init__()
         self.tree_view = tree_view
-        self.model = QFileSystemModel()
-        self.model.setReadOnly(False) # Allow file system modifications
+        self.root_path = None
+        self.model = QStandardItemModel()
+        self.model.setHorizontalHeaderLabels(["Name"])
         self.tree_view.setModel(self.model)
+        self.icon_provider = QFileIconProvider()
+        self._items = {}  # rel_dir -> item holding that directory's children
+        self._snapshot = None
+        self.history = None  # LocalHistory fed by every successful save
 
-        # Hide unnecessary columns
-        for i in range(1, self.model.columnCount()):
-            self.tree_view.setColumnHidden(i, True)
+        self.thread = QThread()
+        self._worker = ProjectTreeWorker()
+        self._worker.moveToThread(self.thread)
+        self._refresh_requested.connect(self._worker.refresh)
+        self._worker.directory_listed.connect(self._on_directory_listed)
+        self._worker.finished.connect(self._on_refresh_finished)
+        self.thread.start()
 
     def set_root_path(self, path):
         """Sets the root directory for the file explorer."""
         self.root_path = path
-        self.tree_view.setRootIndex(self.model.setRootPath(path))
+        self.model.removeRows(0, self.model.rowCount())
+        self._items = {"": self.model.invisibleRootItem()}
+        self._snapshot = load_snapshot(path)
+        for rel_dir, info in self._snapshot["dirs"].items():
+            self._apply_listing(rel_dir, info["entries"])
+        self.refresh()
+
+    def refresh(self):
+        """Re-lists changed directories on the background thread."""
+        if self.root_path:
+            self._refresh_requested.emit(self.root_path, self._snapshot)
+
+    def stop(self):
+        self.thread.quit()
+        self.thread.wait()
 
     def get_path(self, index: QModelIndex):
         """Gets the file or directory path for a given model index."""
-        return self.model.filePath(index)
+        return index.data(PATH_ROLE) or ""
+
+    def file_name(self, index: QModelIndex):
+        return os.path.basename(self.get_path(index))
+
+    def _on_directory_listed(self, root_path, rel_dir, entries):
+        if root_path == self.root_path:
+            self._apply_listing(rel_dir, entries)
+
+    def _on_refresh_finished(self, root_path, snapshot):
+        if root_path == self.root_path:
+            self._snapshot = snapshot
+
+    def _apply_listing(self, rel_dir, entries):
+        """Patches one directory's children in place so expansion state survives."""
+        parent = self._items.get(rel_dir)
+        if parent is None:
+            return
+        wanted = {(name, is_dir) for name, is_dir in entries}
+        for row in reversed(range(parent.rowCount())):
+            child = parent.child(row)
+            key = (child.text(), bool(child.data(IS_DIR_ROLE)))
+            if key not in wanted:
+                if key[1]:
+                    self._forget_subtree(self._join(rel_dir, key[0]))
+                parent.removeRow(row)
+            else:
+                wanted.discard(key)
+
+        for row, (name, is_dir) in enumerate(entries):
+            if (name, is_dir) in wanted:
+                parent.insertRow(row, self._make_item(rel_dir, name, is_dir))
+
+    def _make_item(self, rel_dir, name, is_dir):
+        rel_path = self._join(rel_dir, name)
+        item = QStandardItem(name)
+        item.setEditable(False)
+        item.setData(os.path.join(self.root_path, *rel_path.split("/")), PATH_ROLE)
+        item.setData(is_dir, IS_DIR_ROLE)
+        icon_type = QFileIconProvider.IconType.Folder if is_dir else QFileIconProvider.IconType.File
+        item.setIcon(self.icon_provider.icon(icon_type))
+        if is_dir:
+            self._items[rel_path] = item
+        return item
+
+    def _forget_subtree(self, rel_dir):
+        prefix = rel_dir + "/"
+        for key in [k for k in self._items if k == rel_dir or k.startswith(prefix)]:
+            del self._items[key]
+
+    @staticmethod
+    def _join(rel_dir, name):
+        return f"{rel_dir}/{name}" if rel_dir else name
 
     def read_file(self, file_path):
         """Reads the content of a file."""
@@ -39,6 +128,8 @@ class FileManager:
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
+            if self.history:
+                self.history.record(file_path, content)
             return True
         except Exception as e:
             print(f"Error saving file {file_path}: {e}")
@@ -49,6 +140,7 @@ class FileManager:
         try:
             path = os.path.join(parent_dir_path, name)
             open(path, 'a').close()
+            self.refresh()
             return True
         except Exception as e:
             print(f"Error creating file {name}: {e}")
@@ -58,6 +150,7 @@ class FileManager:
         """Creates a new empty folder."""
         try:
             os.makedirs(os.path.join(parent_dir_path, name))
+            self.refresh()
             return True
         except Exception as e:
             print(f"Error creating folder {name}: {e}")
@@ -65,12 +158,21 @@ class FileManager:
 
     def rename_item(self, index: QModelIndex, new_name):
         """Renames a file or folder."""
-        self.model.setData(index, new_name)
+        path = self.get_path(index)
+        try:
+            os.rename(path, os.path.join(os.path.dirname(path), new_name))
+            self.refresh()
+        except Exception as e:
+            print(f"Error renaming {path}: {e}")
 
     def delete_item(self, index: QModelIndex):
         """Deletes a file or folder."""
         path = self.get_path(index)
-        if os.path.isdir(path):
-            self.model.rmdir(index)
-        else:
-            self.model.remove(index)
\ No newline at end of file
+        try:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+            self.refresh()
+        except Exception as e:
+            print(f"Error deleting {path}: {e}")
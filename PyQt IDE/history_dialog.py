@@ -0,0 +1,65 @@
+# history_dialog.py
+
+import os
+from datetime import datetime
+from PyQt6.QtWidgets import (QDialog, QSplitter, QListWidget, QListWidgetItem, QPlainTextEdit,
+                             QVBoxLayout, QHBoxLayout, QPushButton)
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt
+
+
+class HistoryDialog(QDialog):
+    """Shows a file's local history timeline and a diff against the editor's text."""
+
+    def __init__(self, history, editor, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.editor = editor
+        file_path = editor.property("file_path")
+        self.setWindowTitle(f"Local History - {os.path.basename(file_path)}")
+        self.resize(1000, 600)
+
+        self.version_list = QListWidget()
+        for entry in history.timeline(file_path):
+            label = datetime.fromtimestamp(entry["time"]).strftime("%Y-%m-%d %H:%M:%S")
+            item = QListWidgetItem(f"{label}  ({entry['size']} chars)")
+            item.setData(Qt.ItemDataRole.UserRole, entry["hash"])
+            self.version_list.addItem(item)
+        self.version_list.currentItemChanged.connect(self.show_diff)
+
+        self.diff_view = QPlainTextEdit()
+        self.diff_view.setReadOnly(True)
+        self.diff_view.setFont(QFont("JetBrains Mono", 10))
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        splitter.addWidget(self.version_list)
+        splitter.addWidget(self.diff_view)
+        splitter.setSizes([250, 750])
+
+        restore_button = QPushButton("Restore Selected Version")
+        restore_button.clicked.connect(self.restore_selected)
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        buttons.addWidget(restore_button)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(splitter)
+        layout.addLayout(buttons)
+
+        if self.version_list.count():
+            self.version_list.setCurrentRow(0)
+        else:
+            self.diff_view.setPlainText("No history recorded for this file yet.")
+
+    def show_diff(self, item, _previous=None):
+        if item is None:
+            return
+        diff = self.history.diff(item.data(Qt.ItemDataRole.UserRole), self.editor.text())
+        self.diff_view.setPlainText(diff or "Identical to the current editor contents.")
+
+    def restore_selected(self):
+        item = self.version_list.currentItem()
+        if item is None:
+            return
+        self.editor.setText(self.history.content(item.data(Qt.ItemDataRole.UserRole)))
+        self.accept()
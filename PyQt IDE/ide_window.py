@@ -6,10 +6,14 @@ from PyQt6.QtWidgets import (QMainWindow, QSplitter, QWidget, QVBoxLayout,
 from PyQt6.QtGui import QAction
 from PyQt6.QtCore import Qt, QTimer, QModelIndex, QPoint
 from editor_widget import EditorWidget
-from preview_runner import PreviewRunner
 from file_manager import FileManager
 from styles import STYLESHEET
 from background_saver import BackgroundSaver  # Import the new saver
+from diagnostics import DiagnosticsService
+from session import load_session, save_session
+from local_history import LocalHistory
+from history_dialog import HistoryDialog
+from startup_timer import startup_timer
 
 
 class IDEWindow(QMainWindow):
@@ -18,19 +22,56 @@ class IDEWindow(QMainWindow):
         self.setWindowTitle("PyQt6 Live IDE")
         self.setGeometry(100, 100, 1800, 900)
         self.project_path = None
+        self.background_saver = None
+        self.history = None
+        self._runner = None
+        self._preview_pending = False
+        self._last_preview = None
+        self._startup_finished = False
+
+        self.diagnostics = DiagnosticsService()
+        self.diagnostics.diagnostics_ready.connect(self.on_diagnostics_ready)
 
         self._create_menu_bar()
         self._setup_ui()
-        self._setup_default_project()
+        if not self._restore_session():
+            self._setup_default_project()
         self.setStyleSheet(STYLESHEET)
+        startup_timer.mark("window built")
+
+    @property
+    def runner(self):
+        # The preview machinery (and AutoInstaller) is only imported on first use
+        if self._runner is None:
+            from preview_runner import PreviewRunner
+            self._runner = PreviewRunner(self.preview_layout)
+        return self._runner
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._startup_finished:
+            self._startup_finished = True
+            # Runs once the event loop has painted the first frame
+            QTimer.singleShot(0, self._finish_startup)
+
+    def _finish_startup(self):
+        """Starts the subsystems that aren't needed for a typeable editor."""
+        startup_timer.mark("first frame")
+        if self.project_path:
+            self.file_manager.set_root_path(self.project_path)
+
+        self.history = LocalHistory()
+        self.file_manager.history = self.history
 
         # --- NEW: Start the background auto-saver ---
         self.background_saver = BackgroundSaver(self)
         self.background_saver.start()
+        startup_timer.mark("deferred subsystems")
+        print(startup_timer.report())
 
     def _setup_ui(self):
-        # (This function is unchanged)
         main_splitter = QSplitter(Qt.Orientation.Horizontal)
+        self.main_splitter = main_splitter
         self.setCentralWidget(main_splitter)
         self.file_explorer = QTreeView()
         self.file_manager = FileManager(self.file_explorer)
@@ -46,13 +87,11 @@ class IDEWindow(QMainWindow):
         main_splitter.addWidget(self.tab_widget)
         main_splitter.addWidget(self.preview_container)
         main_splitter.setSizes([250, 800, 750])
-        self.runner = PreviewRunner(self.preview_layout)
         self.debounce_timer = QTimer(self)
         self.debounce_timer.setSingleShot(True)
-        self.debounce_timer.timeout.connect(self.run_project_preview)
+        self.debounce_timer.timeout.connect(self.check_open_tabs)
 
     def _setup_default_project(self):
-        # (This function is unchanged)
         default_project_path = os.path.join(os.getcwd(), "projects")
         os.makedirs(default_project_path, exist_ok=True)
         default_main_file = os.path.join(default_project_path, "main.py")
@@ -60,19 +99,77 @@ class IDEWindow(QMainWindow):
             with open(default_main_file, 'w') as f:
                 f.write("# Your main application code goes here\n")
         self.project_path = default_project_path
-        self.file_manager.set_root_path(self.project_path)
         self.create_new_tab(default_main_file)
 
+    def _restore_session(self):
+        """Reopens the tabs, cursor positions and splitter sizes of the last session."""
+        session = load_session()
+        if not session or not os.path.isdir(session.get("project_path") or ""):
+            return False
+        self.project_path = session["project_path"]
+        for tab in session.get("tabs", []):
+            if not os.path.isfile(tab["path"]):
+                continue
+            self.create_new_tab(tab["path"])
+            editor = self.tab_widget.currentWidget()
+            editor.setCursorPosition(tab.get("line", 0), tab.get("index", 0))
+            editor.setFirstVisibleLine(tab.get("first_visible", 0))
+        if self.tab_widget.count() == 0:
+            return False
+        self.tab_widget.setCurrentIndex(min(session.get("current", 0), self.tab_widget.count() - 1))
+        if session.get("splitter"):
+            self.main_splitter.setSizes(session["splitter"])
+        return True
+
+    def _save_session(self):
+        tabs = []
+        for i in range(self.tab_widget.count()):
+            editor = self.tab_widget.widget(i)
+            line, index = editor.getCursorPosition()
+            tabs.append({"path": editor.property("file_path"), "line": line, "index": index,
+                         "first_visible": editor.firstVisibleLine()})
+        save_session({
+            "project_path": self.project_path,
+            "tabs": tabs,
+            "current": self.tab_widget.currentIndex(),
+            "splitter": self.main_splitter.sizes(),
+        })
+
     def run_project_preview(self):
-        """Gathers live code from all tabs and runs it from memory."""
-        if not self.project_path: return
+        """
+        Gathers live code from all tabs and runs it from memory. Waits until
+        the diagnostics worker has checked every tab's current content.
+        """
+        if not self._preview_pending or not self.project_path:
+            return
 
         live_code = {}
+        results = {}
         for i in range(self.tab_widget.count()):
             editor = self.tab_widget.widget(i)
             file_path = editor.property("file_path")
+            code = editor.text()
+            results[file_path] = self.diagnostics.cached(code)
+            if results[file_path] is None:
+                return  # on_diagnostics_ready calls back once the worker is done
             module_name = os.path.splitext(os.path.basename(file_path))[0]
-            live_code[module_name] = editor.text()
+            live_code[module_name] = code
+        self._preview_pending = False
+
+        # Same code as the last run (e.g. an edit that was undone)
+        if live_code == self._last_preview:
+            return
+        self._last_preview = live_code
+
+        # Don't pay for a run that is guaranteed to fail on a syntax error
+        for file_path, diagnostics in results.items():
+            errors = [d for d in diagnostics if d.message.startswith("SyntaxError")]
+            if errors:
+                file_name = os.path.basename(file_path)
+                self.runner.clear_preview()
+                self.runner.display_error(
+                    f"{file_name}, line {errors[0].line + 1}: {errors[0].message}")
+                return
 
         main_module_name = "main" if "main" in live_code else "app"
 
@@ -81,6 +178,30 @@ class IDEWindow(QMainWindow):
         else:
             self.runner.display_error("No 'main.py' or 'app.py' tab is open.")
 
+    def check_open_tabs(self):
+        """Queues diagnostics for open tabs; unchanged tabs are skipped by the service."""
+        self._preview_pending = True
+        for i in range(self.tab_widget.count()):
+            editor = self.tab_widget.widget(i)
+            self.diagnostics.submit(editor.property("file_path"), editor.text())
+        # Runs now if every tab was already checked, otherwise from on_diagnostics_ready
+        self.run_project_preview()
+
+    def on_diagnostics_ready(self, file_path, diagnostics):
+        for i in range(self.tab_widget.count()):
+            editor = self.tab_widget.widget(i)
+            if editor.property("file_path") == file_path:
+                editor.show_diagnostics(diagnostics)
+        self.run_project_preview()
+
+    def closeEvent(self, event):
+        self._save_session()
+        self.diagnostics.stop()
+        self.file_manager.stop()
+        if self.history:
+            self.history.stop()
+        super().closeEvent(event)
+
     # --- Other methods remain unchanged, including the NEW save_all_open_tabs ---
 
     def save_all_open_tabs(self):
@@ -103,6 +224,14 @@ class IDEWindow(QMainWindow):
         save_action.triggered.connect(self.save_current_file)
         save_action.setShortcut("Ctrl+S")
         file_menu.addAction(save_action)
+        refresh_action = QAction("Refresh Explorer", self)
+        refresh_action.triggered.connect(lambda: self.file_manager.refresh())
+        refresh_action.setShortcut("F5")
+        file_menu.addAction(refresh_action)
+        history_action = QAction("Local History...", self)
+        history_action.triggered.connect(self.show_local_history)
+        history_action.setShortcut("Ctrl+Shift+H")
+        file_menu.addAction(history_action)
 
     def open_folder(self):
         path = QFileDialog.getExistingDirectory(self, "Open Folder")
@@ -118,6 +247,11 @@ class IDEWindow(QMainWindow):
         if self.file_manager.save_file(file_path, content):
             print(f"Saved: {file_path}")
 
+    def show_local_history(self):
+        if self.tab_widget.count() == 0 or not self.history:
+            return
+        HistoryDialog(self.history, self.tab_widget.currentWidget(), self).exec()
+
     def open_file_from_explorer(self, index: QModelIndex):
         file_path = self.file_manager.get_path(index)
         if os.path.isfile(file_path):
@@ -137,8 +271,10 @@ class IDEWindow(QMainWindow):
             tab_name = os.path.basename(file_path)
             index = self.tab_widget.addTab(editor, tab_name)
             self.tab_widget.setCurrentIndex(index)
+            self.diagnostics.submit(file_path, content)
 
     def close_tab(self, index):
+        self.diagnostics.forget(self.tab_widget.widget(index).property("file_path"))
         self.tab_widget.removeTab(index)
 
     def on_text_changed(self):
@@ -176,7 +312,7 @@ class IDEWindow(QMainWindow):
                 self.file_manager.create_folder(path, name)
 
     def rename_item(self, index: QModelIndex):
-        current_name = self.file_manager.model.fileName(index)
+        current_name = self.file_manager.file_name(index)
         new_name, ok = QInputDialog.getText(self, "Rename", "Enter new name:", text=current_name)
         if ok and new_name and new_name != current_name:
             self.file_manager.rename_item(index, new_name)
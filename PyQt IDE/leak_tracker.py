@@ -0,0 +1,112 @@
+# leak_tracker.py
+
+import gc
+import os
+import tracemalloc
+import weakref
+from PyQt6.QtCore import QObject
+from PyQt6.QtWidgets import QApplication
+
+
+class LeakTracker:
+    """
+    Instrumentation for repeated preview runs. When enabled (set the
+    PYQT_IDE_TRACK_LEAKS environment variable, or pass enabled=True), it takes
+    tracemalloc and Qt object-count snapshots around every run, prints the top
+    allocation growth sites and flags preview generations that were never
+    garbage collected.
+    """
+
+    def __init__(self, enabled=None, top_n=10, grace_runs=1):
+        if enabled is None:
+            enabled = bool(os.environ.get("PYQT_IDE_TRACK_LEAKS"))
+        self.enabled = enabled
+        self.top_n = top_n
+        # Older generations get this many later runs to be collected, since
+        # deleteLater() only destroys widgets once the event loop spins.
+        self.grace_runs = grace_runs
+        self.generation = 0
+        self.generations = []  # (generation, [weakref, ...])
+        self._first_snapshot = None
+        self._before_snapshot = None
+        self._before_counts = None
+
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def before_run(self):
+        if not self.enabled:
+            return
+        gc.collect()
+        self._before_snapshot = self._take_snapshot()
+        self._before_counts = self._qt_counts()
+
+    def after_run(self, generation_objects=()):
+        """Records the objects created by this run and prints a growth report."""
+        if not self.enabled or self._before_snapshot is None:
+            return None
+        self.generation += 1
+        refs = []
+        for obj in generation_objects:
+            try:
+                refs.append(weakref.ref(obj))
+            except TypeError:
+                pass  # Not weak-referenceable, nothing to track
+        self.generations.append((self.generation, refs))
+
+        gc.collect()
+        snapshot = self._take_snapshot()
+        counts = self._qt_counts()
+        if self._first_snapshot is None:
+            # Baseline after the first run so one-time imports don't count as growth
+            self._first_snapshot = snapshot
+        report = {
+            "generation": self.generation,
+            "run_growth": snapshot.compare_to(self._before_snapshot, "lineno")[:self.top_n],
+            "session_growth": snapshot.compare_to(self._first_snapshot, "lineno")[:self.top_n],
+            "qt_counts": counts,
+            "qt_count_delta": {k: counts[k] - self._before_counts[k] for k in counts},
+            "uncollected": self._uncollected_generations(),
+        }
+        self._print_report(report)
+        return report
+
+    def _uncollected_generations(self):
+        alive = []
+        remaining = []
+        for generation, refs in self.generations:
+            live_refs = [r for r in refs if r() is not None]
+            if not live_refs:
+                continue  # Fully collected, stop tracking it
+            remaining.append((generation, live_refs))
+            if generation <= self.generation - self.grace_runs:
+                alive.append((generation, [type(r()).__name__ for r in live_refs]))
+        self.generations = remaining
+        return alive
+
+    @staticmethod
+    def _take_snapshot():
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+    @staticmethod
+    def _qt_counts():
+        app = QApplication.instance()
+        return {
+            "widgets": len(app.allWidgets()) if app else 0,
+            "qobjects": sum(1 for obj in gc.get_objects() if isinstance(obj, QObject)),
+        }
+
+    def _print_report(self, report):
+        current, peak = tracemalloc.get_traced_memory()
+        print(f"[LeakTracker] Run {report['generation']}: traced {current / 1024:.1f} KiB "
+              f"(peak {peak / 1024:.1f} KiB), widgets {report['qt_counts']['widgets']} "
+              f"({report['qt_count_delta']['widgets']:+d}), QObjects {report['qt_counts']['qobjects']} "
+              f"({report['qt_count_delta']['qobjects']:+d})")
+        for stat in report["session_growth"]:
+            if stat.size_diff > 0:
+                print(f"[LeakTracker]   {stat}")
+        for generation, type_names in report["uncollected"]:
+            print(f"[LeakTracker] Generation {generation} was not collected: {', '.join(type_names)}")
@@ -0,0 +1,345 @@
+# local_history.py
+
+import difflib
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+HISTORY_DIR = os.path.join(os.path.expanduser("~"), ".pyqt_ide", "history")
+
+
+class LocalHistory:
+    """
+    Keeps earlier versions of saved files.
+
+    Every distinct version is stored once in a content-addressed object store
+    (objects/<hash>), as a zlib-compressed line-level delta against the file's
+    previous version. A full copy is written every `max_chain` versions so a
+    restore never replays a long delta chain. Each file has an append-only
+    timeline (timelines/<path hash>.jsonl). Saves are written on a background
+    thread, and identical content is never stored twice, so disk usage grows
+    with the amount of change rather than the number of saves.
+
+    objects.jsonl indexes each object's delta base and size, so eviction can
+    work out what is reachable without decompressing the store.
+    """
+
+    def __init__(self, history_dir=HISTORY_DIR, max_bytes=200 * 1024 * 1024,
+                 max_age_days=30, max_chain=20, evict_every=200):
+        self.history_dir = history_dir
+        self.objects_dir = os.path.join(history_dir, "objects")
+        self.timelines_dir = os.path.join(history_dir, "timelines")
+        self.index_path = os.path.join(history_dir, "objects.jsonl")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.timelines_dir, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 24 * 3600
+        self.max_chain = max_chain
+        self.evict_every = evict_every
+
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._last_hash = {}  # file_path -> hash of the last recorded version
+        self._heads = {}  # file_path -> (hash, text, depth), worker thread only
+        self._cache = OrderedDict()  # hash -> text, small LRU for reconstruction
+        self._meta = None  # hash -> (base, size), worker thread only; loaded on first use
+        self._records_since_evict = 0
+
+        self._thread = threading.Thread(target=self._run, name="LocalHistory", daemon=True)
+        self._thread.start()
+        self._queue.put(("evict",))
+
+    # --- Public API ---
+
+    def record(self, file_path, content):
+        """Queues a version of a file; does nothing if it matches the last one."""
+        file_path = os.path.abspath(file_path)
+        content_hash = self._hash(content)
+        if self._last_hash.get(file_path) == content_hash:
+            return
+        self._last_hash[file_path] = content_hash
+        self._queue.put(("record", file_path, content, content_hash, time.time()))
+
+    def timeline(self, file_path):
+        """Returns the versions of a file, newest first, as dicts with time/hash/size."""
+        with self._lock:
+            entries = self._read_timeline(os.path.abspath(file_path))
+        return [{"time": e["t"], "hash": e["h"], "size": e["n"]} for e in reversed(entries)]
+
+    def content(self, content_hash):
+        with self._lock:
+            return self._reconstruct(content_hash)
+
+    def diff(self, old_hash, new_text, old_label="history", new_label="current"):
+        """Unified diff between a stored version and some text (e.g. the editor's)."""
+        old_text = self.content(old_hash)
+        return "".join(difflib.unified_diff(
+            old_text.splitlines(keepends=True), new_text.splitlines(keepends=True),
+            fromfile=old_label, tofile=new_label))
+
+    def flush(self):
+        """Blocks until every queued version has been written."""
+        self._queue.join()
+
+    def stop(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    # --- Worker thread ---
+
+    def _run(self):
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                if task[0] == "record":
+                    self._write_version(*task[1:])
+                elif task[0] == "evict":
+                    self._evict()
+            except Exception as e:
+                print(f"[LocalHistory] {task[0]} failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write_version(self, file_path, content, content_hash, timestamp):
+        """
+        Stores one version. The head lookup, delta and object write run without
+        the lock (only this thread writes objects, and readers only ask for
+        hashes already in a timeline), so a slow diff never stalls timeline().
+        """
+        head = self._head(file_path)
+        if head and head[0] == content_hash:
+            return
+        depth = 0
+        if not self._object_exists(content_hash):
+            if head and head[2] < self.max_chain:
+                depth = head[2] + 1
+                payload = {"base": head[0], "depth": depth, "ops": self._delta(head[1], content)}
+            else:
+                payload = {"depth": 0, "text": content}
+            self._write_object(content_hash, payload)
+        else:
+            depth = self._read_object(content_hash).get("depth", 0)
+
+        self._heads[file_path] = (content_hash, content, depth)
+        entry = {"t": timestamp, "h": content_hash, "n": len(content)}
+        with self._lock:
+            with open(self._timeline_path(file_path), "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+        self._records_since_evict += 1
+        if self._records_since_evict >= self.evict_every:
+            self._records_since_evict = 0
+            self._queue.put(("evict",))
+
+    def _head(self, file_path):
+        if file_path not in self._heads:
+            entries = self._read_timeline(file_path)
+            if not entries:
+                return None
+            last_hash = entries[-1]["h"]
+            try:
+                depth = self._read_object(last_hash).get("depth", 0)
+                self._heads[file_path] = (last_hash, self.content(last_hash), depth)
+            except (OSError, ValueError, zlib.error):
+                return None
+        return self._heads[file_path]
+
+    def _evict(self):
+        """
+        Drops versions older than max_age, then the oldest until under max_bytes.
+        Runs without the lock: only this thread writes, timelines are replaced
+        atomically, and the objects it deletes are no longer in any timeline.
+        """
+        self._records_since_evict = 0
+        meta = self._metadata()
+        self._index_unknown_objects(meta)
+        timelines = {}
+        for name in os.listdir(self.timelines_dir):
+            if name.endswith(".jsonl"):
+                timelines[name] = self._read_timeline_file(os.path.join(self.timelines_dir, name))
+
+        cutoff = time.time() - self.max_age
+        for name, entries in timelines.items():
+            # The newest version of each file is always kept
+            timelines[name] = [e for e in entries[:-1] if e["t"] >= cutoff] + entries[-1:]
+
+        live, size = self._live_objects(timelines, meta)
+        while size > self.max_bytes:
+            candidates = [(entries[0]["t"], name) for name, entries in timelines.items() if len(entries) > 1]
+            if not candidates:
+                break
+            # Each pass drops the oldest version from the tenth of files with the oldest history
+            candidates.sort()
+            for _, name in candidates[:max(1, len(candidates) // 10)]:
+                timelines[name].pop(0)
+            live, size = self._live_objects(timelines, meta)
+
+        for name, entries in timelines.items():
+            path = os.path.join(self.timelines_dir, name)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(e, separators=(",", ":")) + "\n" for e in entries)
+            os.replace(tmp_path, path)
+
+        for content_hash in [h for h in meta if h not in live]:
+            try:
+                os.remove(self._object_path(content_hash))
+            except OSError:
+                pass
+            del meta[content_hash]
+        self._save_metadata(meta)
+        with self._lock:
+            self._cache.clear()
+
+    def _live_objects(self, timelines, meta):
+        """Objects reachable from the kept versions (including delta bases) and their disk size."""
+        live = set()
+        size = 0
+        for entries in timelines.values():
+            for entry in entries:
+                content_hash = entry["h"]
+                while content_hash and content_hash not in live:
+                    if content_hash not in meta:
+                        break  # Missing object
+                    live.add(content_hash)
+                    base, object_size = meta[content_hash]
+                    size += object_size
+                    content_hash = base
+        return live, size
+
+    # --- Object index ---
+
+    def _metadata(self):
+        if self._meta is None:
+            self._meta = {}
+            for entry in self._read_timeline_file(self.index_path):
+                self._meta[entry["h"]] = (entry.get("b"), entry["s"])
+        return self._meta
+
+    def _index_unknown_objects(self, meta):
+        """Indexes objects missing from objects.jsonl, e.g. ones stored before it existed."""
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            for rest in os.listdir(prefix_dir):
+                content_hash = prefix + rest
+                if content_hash in meta or rest.endswith(".tmp"):
+                    continue
+                try:
+                    base = self._read_object(content_hash).get("base")
+                except (OSError, ValueError, zlib.error):
+                    base = None  # Unreadable; dropped unless a timeline still uses it
+                meta[content_hash] = (base, os.path.getsize(os.path.join(prefix_dir, rest)))
+
+    def _save_metadata(self, meta):
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(self._meta_line(h, base, size) for h, (base, size) in meta.items())
+        os.replace(tmp_path, self.index_path)
+
+    @staticmethod
+    def _meta_line(content_hash, base, size):
+        return json.dumps({"h": content_hash, "b": base, "s": size}, separators=(",", ":")) + "\n"
+
+    # --- Storage helpers ---
+
+    @staticmethod
+    def _hash(text):
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _delta(old_text, new_text):
+        """Line ops that rebuild new_text: [start, end] copies base lines, a list inserts lines."""
+        old_lines = old_text.splitlines(keepends=True)
+        new_lines = new_text.splitlines(keepends=True)
+        ops = []
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                ops.append([i1, i2])
+            elif j2 > j1:
+                ops.append(["+"] + new_lines[j1:j2])
+        return ops
+
+    def _reconstruct(self, content_hash):
+        if content_hash in self._cache:
+            self._cache.move_to_end(content_hash)
+            return self._cache[content_hash]
+        # Walk back to the nearest full copy, then replay deltas forwards
+        chain = []
+        current = content_hash
+        text = None
+        while text is None:
+            if current in self._cache:
+                text = self._cache[current]
+                break
+            payload = self._read_object(current)
+            if "text" in payload:
+                text = payload["text"]
+            else:
+                chain.append(payload["ops"])
+                current = payload["base"]
+        for ops in reversed(chain):
+            base_lines = text.splitlines(keepends=True)
+            parts = []
+            for op in ops:
+                if op and op[0] == "+":
+                    parts.extend(op[1:])
+                else:
+                    parts.extend(base_lines[op[0]:op[1]])
+            text = "".join(parts)
+
+        self._cache[content_hash] = text
+        if len(self._cache) > 32:
+            self._cache.popitem(last=False)
+        return text
+
+    def _object_path(self, content_hash):
+        return os.path.join(self.objects_dir, content_hash[:2], content_hash[2:])
+
+    def _object_exists(self, content_hash):
+        return os.path.exists(self._object_path(content_hash))
+
+    def _read_object(self, content_hash):
+        with open(self._object_path(content_hash), "rb") as f:
+            return json.loads(zlib.decompress(f.read()).decode("utf-8"))
+
+    def _write_object(self, content_hash, payload):
+        path = self._object_path(content_hash)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        data = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), 9)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        base = payload.get("base")
+        self._metadata()[content_hash] = (base, len(data))
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(self._meta_line(content_hash, base, len(data)))
+
+    def _timeline_path(self, file_path):
+        key = hashlib.sha1(file_path.encode("utf-8")).hexdigest()
+        return os.path.join(self.timelines_dir, f"{key}.jsonl")
+
+    def _read_timeline(self, file_path):
+        return self._read_timeline_file(self._timeline_path(file_path))
+
+    @staticmethod
+    def _read_timeline_file(path):
+        entries = []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        pass  # Torn write from a crash; skip the line
+        except OSError:
+            pass
+        return entries
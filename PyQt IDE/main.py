@@ -1,11 +1,16 @@
 # main.py
 
+from startup_timer import startup_timer  # Imported first so it times the Qt imports too
 import sys
-from PyQt5.QtWidgets import QApplication
-from ide_window import IDEWindow
+from PyQt6.QtWidgets import QApplication
 
 if __name__ == "__main__":
+    startup_timer.mark("qt import")
     app = QApplication(sys.argv)
+    startup_timer.mark("QApplication")
+    from ide_window import IDEWindow
+    startup_timer.mark("ide modules import")
     window = IDEWindow()
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    startup_timer.mark("window shown")
+    sys.exit(app.exec())
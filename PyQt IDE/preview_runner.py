@@ -7,7 +7,7 @@ from importlib.abc import MetaPathFinder, Loader
 from importlib.machinery import ModuleSpec
 from PyQt6.QtWidgets import QWidget, QMainWindow, QLabel, QVBoxLayout
 from PyQt6.QtCore import Qt
-from auto_installer import AutoInstaller
+from leak_tracker import LeakTracker
 
 
 class CodeSanitizer(ast.NodeTransformer):
@@ -33,6 +33,18 @@ class InMemoryImporter(MetaPathFinder, Loader):
             return ModuleSpec(fullname, self, origin=f"<in-memory:{fullname}>", is_package=False)
         return None
 
+    @classmethod
+    def take_modules(cls, code_dict):
+        """
+        Removes from sys.modules every module loaded from memory by any earlier
+        run (so a module that is no longer open can't still be imported) plus
+        any module the new code shadows, and returns them.
+        """
+        names = [name for name, module in list(sys.modules.items())
+                 if isinstance(getattr(getattr(module, "__spec__", None), "loader", None), cls)]
+        names += [name for name in code_dict if name in sys.modules and name not in names]
+        return [sys.modules.pop(name) for name in names]
+
     def exec_module(self, module):
         # Sanitize the code before executing it
         tree = ast.parse(self.code_dict[module.__name__])
@@ -44,10 +56,22 @@ class InMemoryImporter(MetaPathFinder, Loader):
         exec(safe_code, module.__dict__)
 
 
+def find_widget_class(namespace):
+    """Picks the widget to preview: the first QMainWindow subclass, else the last QWidget subclass."""
+    widget_class = None
+    for obj in namespace.values():
+        if isinstance(obj, type) and issubclass(obj, QMainWindow) and obj is not QMainWindow:
+            return obj
+        elif isinstance(obj, type) and issubclass(obj, QWidget) and obj is not QWidget:
+            widget_class = obj
+    return widget_class
+
+
 class PreviewRunner:
     def __init__(self, preview_layout):
         self.preview_layout = preview_layout
         self.current_widget = None
+        self.leak_tracker = LeakTracker()
 
     def clear_preview(self):
         if self.current_widget:
@@ -63,17 +87,18 @@ class PreviewRunner:
             self.display_error(f"Main module '{main_module_name}' not found.")
             return
 
+        self.leak_tracker.before_run()
         importer = InMemoryImporter(code_dict)
 
         # --- THE SMART FIX: Manually clear old modules from Python's cache ---
         # This forces Python to re-import our live code every time.
-        for module_name in code_dict:
-            if module_name in sys.modules:
-                del sys.modules[module_name]
+        self._release_modules(InMemoryImporter.take_modules(code_dict))
 
         sys.meta_path.insert(0, importer)
+        main_module = None
 
         try:
+            from auto_installer import AutoInstaller  # Deferred until the first preview run
             AutoInstaller.install_missing_modules(main_code)
 
             # Use importlib to properly load the main module.
@@ -81,14 +106,7 @@ class PreviewRunner:
             main_module = importlib.import_module(main_module_name)
 
             # Now inspect the fully imported module to find the widget
-            local_env = main_module.__dict__
-            widget_class = None
-            for obj in local_env.values():
-                if isinstance(obj, type) and issubclass(obj, QMainWindow) and obj is not QMainWindow:
-                    widget_class = obj
-                    break
-                elif isinstance(obj, type) and issubclass(obj, QWidget) and obj is not QWidget:
-                    widget_class = obj
+            widget_class = find_widget_class(main_module.__dict__)
 
             if widget_class:
                 widget_instance = widget_class()
@@ -102,6 +120,19 @@ class PreviewRunner:
             # CRITICAL: Always remove the custom importer
             if importer in sys.meta_path:
                 sys.meta_path.remove(importer)
+            self.leak_tracker.after_run([main_module, self.current_widget])
+
+    @staticmethod
+    def _release_modules(modules):
+        """
+        Clears the namespaces of replaced in-memory modules. Their functions and
+        classes reference the module dict, forming cycles that would otherwise
+        keep every previous generation alive until a full GC pass.
+        """
+        for module in modules:
+            # Only touch modules we created; a tab may share a name with a real module
+            if isinstance(getattr(module.__spec__, "loader", None), InMemoryImporter):
+                module.__dict__.clear()
 
     def create_preview_container(self, widget_instance):
         # (This function is unchanged)
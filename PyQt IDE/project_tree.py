@@ -0,0 +1,148 @@
+# project_tree.py
+
+import fnmatch
+import hashlib
+import json
+import os
+from collections import deque
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+DEFAULT_IGNORES = ["venv/", ".venv/", "node_modules/", ".git/", "__pycache__/", "*.pyc"]
+SNAPSHOT_DIR = os.path.join(os.path.expanduser("~"), ".pyqt_ide", "explorer")
+SNAPSHOT_VERSION = 1
+
+
+class IgnoreRules:
+    """
+    A small subset of .gitignore semantics: `#` comments, `!` negation,
+    trailing `/` for directory-only patterns and leading or inner `/` for
+    patterns anchored to the project root. The last matching pattern wins.
+    """
+
+    def __init__(self, root_path, extra_patterns=DEFAULT_IGNORES):
+        self.lines = list(extra_patterns)
+        gitignore = os.path.join(root_path, ".gitignore")
+        try:
+            with open(gitignore, "r", encoding="utf-8") as f:
+                self.lines += f.read().splitlines()
+        except OSError:
+            pass
+        self.rules = [r for r in (self._parse(line) for line in self.lines) if r]
+
+    @property
+    def fingerprint(self):
+        return hashlib.sha1("\n".join(self.lines).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _parse(line):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            return None
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/") if dir_only else line
+        anchored = "/" in line
+        line = line.lstrip("/")
+        if not line:
+            return None
+        return line, negate, dir_only, anchored
+
+    def is_ignored(self, rel_path, is_dir):
+        """`rel_path` is relative to the project root and uses `/` separators."""
+        name = rel_path.rsplit("/", 1)[-1]
+        ignored = False
+        for pattern, negate, dir_only, anchored in self.rules:
+            if dir_only and not is_dir:
+                continue
+            target = rel_path if anchored else name
+            # `**/` may match zero or more directories
+            if any(fnmatch.fnmatchcase(target, p) for p in
+                   {pattern.replace("**", "*"), pattern.replace("**/", "")}):
+                ignored = not negate
+        return ignored
+
+
+def list_directory(root_path, rel_dir, rules):
+    """Lists one directory as sorted [name, is_dir] pairs, directories first."""
+    entries = []
+    try:
+        with os.scandir(os.path.join(root_path, rel_dir)) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if not rules.is_ignored(rel_path, is_dir):
+                    entries.append([entry.name, is_dir])
+    except OSError:
+        pass
+    entries.sort(key=lambda e: (not e[1], e[0].lower()))
+    return entries
+
+
+def snapshot_path(root_path):
+    key = hashlib.sha1(os.path.abspath(root_path).encode("utf-8")).hexdigest()
+    return os.path.join(SNAPSHOT_DIR, f"{key}.json")
+
+
+def load_snapshot(root_path):
+    """Returns the persisted tree snapshot for a project, or an empty one."""
+    try:
+        with open(snapshot_path(root_path), "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if snapshot.get("version") == SNAPSHOT_VERSION:
+            return snapshot
+    except (OSError, ValueError):
+        pass
+    return {"version": SNAPSHOT_VERSION, "rules": None, "dirs": {}}
+
+
+def save_snapshot(root_path, snapshot):
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        tmp_path = snapshot_path(root_path) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+        os.replace(tmp_path, snapshot_path(root_path))
+    except OSError as e:
+        print(f"Error saving explorer snapshot for {root_path}: {e}")
+
+
+class ProjectTreeWorker(QObject):
+    """
+    Refreshes a project's tree snapshot on a background thread. Directories
+    whose mtime matches the snapshot are not listed again; every directory that
+    did change is emitted (parents before children) so the model can patch it.
+    """
+    directory_listed = pyqtSignal(str, str, object)  # root, rel_dir, entries
+    finished = pyqtSignal(str, object)  # root, snapshot
+
+    @pyqtSlot(str, object)
+    def refresh(self, root_path, snapshot):
+        rules = IgnoreRules(root_path)
+        cached_dirs = snapshot["dirs"] if snapshot.get("rules") == rules.fingerprint else {}
+        dirs = {}
+        queue = deque([""])
+        while queue:
+            rel_dir = queue.popleft()
+            try:
+                mtime = os.stat(os.path.join(root_path, rel_dir)).st_mtime_ns
+            except OSError:
+                continue
+            cached = cached_dirs.get(rel_dir)
+            if cached and cached["mtime"] == mtime:
+                entries = cached["entries"]
+            else:
+                entries = list_directory(root_path, rel_dir, rules)
+                self.directory_listed.emit(root_path, rel_dir, entries)
+            dirs[rel_dir] = {"mtime": mtime, "entries": entries}
+            for name, is_dir in entries:
+                if is_dir:
+                    queue.append(f"{rel_dir}/{name}" if rel_dir else name)
+
+        new_snapshot = {"version": SNAPSHOT_VERSION, "rules": rules.fingerprint, "dirs": dirs}
+        save_snapshot(root_path, new_snapshot)
+        self.finished.emit(root_path, new_snapshot)
@@ -0,0 +1,25 @@
+# session.py
+
+import json
+import os
+
+SESSION_FILE = os.path.join(os.path.expanduser("~"), ".pyqt_ide", "session.json")
+
+
+def load_session():
+    """Returns the last saved session, or None if there isn't a usable one."""
+    try:
+        with open(SESSION_FILE, "r", encoding="utf-8") as f:
+            session = json.load(f)
+        return session if isinstance(session, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def save_session(session):
+    try:
+        os.makedirs(os.path.dirname(SESSION_FILE), exist_ok=True)
+        with open(SESSION_FILE, "w", encoding="utf-8") as f:
+            json.dump(session, f, separators=(",", ":"))
+    except OSError as e:
+        print(f"Error saving session: {e}")
@@ -0,0 +1,29 @@
+# startup_timer.py
+
+import time
+
+
+class StartupTimer:
+    """Records the duration of each startup phase and prints a timing report."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self._last = self.start
+        self.phases = []
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def total(self):
+        return self._last - self.start
+
+    def report(self):
+        lines = [f"[Startup] {phase:<28} {seconds * 1000:8.1f} ms" for phase, seconds in self.phases]
+        lines.append(f"[Startup] {'total':<28} {self.total() * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+# Created on first import, which main.py does before importing Qt
+startup_timer = StartupTimer()
@@ -0,0 +1,37 @@
+"""Tests for batch_preview; run with `python -m pytest` from the PyQt IDE folder."""
+import batch_preview
+
+MAIN_WITH_UTIL = """\
+from PyQt6.QtWidgets import QWidget
+from util import W
+
+class Preview(W):
+    pass
+"""
+
+UTIL = """\
+from PyQt6.QtWidgets import QWidget
+
+class W(QWidget):
+    pass
+"""
+
+
+def write_project(root, name, files):
+    project = root / name
+    project.mkdir()
+    for file_name, source in files.items():
+        (project / file_name).write_text(source, encoding="utf-8")
+    return str(project)
+
+
+def test_modules_from_an_earlier_project_are_not_importable(tmp_path):
+    # One worker renders both projects, so `util` from the first one is still loaded
+    with_util = write_project(tmp_path, "a", {"main.py": MAIN_WITH_UTIL, "util.py": UTIL})
+    without_util = write_project(tmp_path, "b", {"main.py": MAIN_WITH_UTIL})
+
+    results = batch_preview.run_batch([with_util, without_util], str(tmp_path / "out"), jobs=1)
+
+    assert results[0]["success"], results[0].get("error")
+    assert not results[1]["success"]
+    assert "util" in results[1]["error"]
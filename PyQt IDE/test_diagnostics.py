@@ -0,0 +1,22 @@
+"""Tests for diagnostics; run with `python -m pytest` from the PyQt IDE folder."""
+import diagnostics
+
+
+def messages(code):
+    return [(d.line, d.message) for d in diagnostics.run_checks(code)]
+
+
+def test_walrus_in_module_level_comprehension_binds_at_module_scope():
+    code = "xs = [1, 2, 3]\nif any((n := i) > 2 for i in xs):\n    print(n)\n"
+    assert messages(code) == []
+
+
+def test_walrus_in_function_comprehension_stays_local():
+    code = "xs = [1]\ndef f():\n    [(k := i) for i in xs]\n    return k\nprint(k)\n"
+    assert messages(code) == [(4, "Undefined name 'k'")]
+
+
+def test_names_in_string_annotations_count_as_used():
+    code = ("from typing import Dict, List, Set\nimport os\n"
+            "def f(x: 'Dict[str, int]') -> \"List['Set[int]']\":\n    pass\n")
+    assert messages(code) == [(1, "'os' imported but unused")]
@@ -0,0 +1,189 @@
+# wheelhouse.py
+"""
+Local wheel cache for AutoInstaller.
+
+Every package fetched from an index is first built into wheels (together with
+its whole resolved dependency set) in the wheelhouse directory, and then
+installed from there with --no-index. Later installs, in this or any fresh
+venv, are served from the wheelhouse without touching the network, which is
+also how offline machines are supported. The wheelhouse can be prewarmed from
+a requirements file.
+
+The index used for fetching is pip's configured one unless IDE_PACKAGE_INDEX
+is set, either to an index URL or to a local directory of wheels (the latter
+needs no network at all). IDE_WHEELHOUSE moves the wheelhouse and
+IDE_OFFLINE=1 forbids fetching.
+
+AI-IDE/py/wheelhouse.py holds a copy of the Wheelhouse class (the apps in
+this repo are self-contained and never import from each other); keep fixes
+to it in sync.
+
+Usage:
+    python wheelhouse.py prewarm requirements.txt
+    python wheelhouse.py install requests numpy
+    python wheelhouse.py list
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlparse, unquote
+
+WHEELHOUSE_DIR = os.environ.get("IDE_WHEELHOUSE") or os.path.join(
+    os.path.expanduser("~"), ".pyqt_ide", "wheelhouse")
+MANIFEST_FILE = "manifest.json"
+DEFAULT_INDEX = "https://pypi.org/simple"
+
+
+def print_log(message):
+    print(f"[Wheelhouse] {message}")
+
+
+class Wheelhouse:
+    """Installs packages from a local wheel directory, capturing new ones on first use."""
+
+    def __init__(self, path=WHEELHOUSE_DIR, index=None, python=sys.executable, output=None, log=print_log):
+        self.path = path
+        self.index = index if index is not None else os.environ.get("IDE_PACKAGE_INDEX")
+        self.python = python
+        self.output = output  # Where pip's own output goes; None inherits stdout
+        self.log = log
+        self._offline = None
+        os.makedirs(path, exist_ok=True)
+
+    # --- Public API ---
+
+    def install(self, requirements):
+        """Installs from the wheelhouse, fetching and capturing whatever is not there yet."""
+        requirements = list(requirements)
+        if self._pip("install", *self._local_args(), *requirements, quiet=True) == 0:
+            self.log(f"Installed {', '.join(requirements)} from {self.path}")
+            return True
+        if self.is_offline():
+            self.log(f"Offline and {', '.join(requirements)} not in the wheelhouse")
+            return False
+        if not self.capture(requirements):
+            return False
+        return self._pip("install", *self._local_args(), *requirements) == 0
+
+    def capture(self, requirements):
+        """Builds wheels for the requirements and all their dependencies into the wheelhouse."""
+        requirements = list(requirements)
+        self.log(f"Capturing {', '.join(requirements)}...")
+        if self._pip("wheel", "--wheel-dir", self.path, "--find-links", self.path,
+                     *self._index_args(), *requirements) != 0:
+            self.log(f"Failed to fetch {', '.join(requirements)}")
+            return False
+        manifest = self.manifest()
+        for requirement in requirements:
+            manifest[requirement] = {"wheels": self._resolve(requirement), "time": time.time()}
+        self._save_manifest(manifest)
+        return True
+
+    def prewarm(self, requirements_file):
+        """Captures every requirement in a requirements file that is not cached yet."""
+        with open(requirements_file, "r", encoding="utf-8") as f:
+            requirements = [line.split("#", 1)[0].strip() for line in f]
+        requirements = [r for r in requirements if r and not r.startswith("-")]
+        missing = [r for r in requirements if not self.has(r)]
+        if not missing:
+            self.log(f"All {len(requirements)} requirements already cached")
+            return True
+        return self.capture(missing)
+
+    def has(self, requirement):
+        """True if the requirement was captured and all of its wheels are still present."""
+        wheels = self.manifest().get(requirement, {}).get("wheels")
+        return bool(wheels) and all(os.path.exists(os.path.join(self.path, w)) for w in wheels)
+
+    def manifest(self):
+        try:
+            with open(os.path.join(self.path, MANIFEST_FILE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def is_offline(self):
+        if self._offline is None:
+            if os.environ.get("IDE_OFFLINE") == "1":
+                self._offline = True
+            elif self.index and os.path.isdir(self.index):
+                self._offline = False
+            else:
+                url = urlparse(self.index or os.environ.get("PIP_INDEX_URL") or DEFAULT_INDEX)
+                try:
+                    port = url.port or (443 if url.scheme == "https" else 80)
+                    socket.create_connection((url.hostname, port), timeout=2).close()
+                    self._offline = False
+                except (OSError, ValueError):
+                    self._offline = True
+        return self._offline
+
+    # --- Helpers ---
+
+    def _local_args(self):
+        return ["--no-index", "--find-links", self.path]
+
+    def _index_args(self):
+        if not self.index:
+            return []
+        if os.path.isdir(self.index):
+            return ["--no-index", "--find-links", self.index]
+        return ["--index-url", self.index]
+
+    def _resolve(self, requirement):
+        """Wheel file names pip picks from the wheelhouse for one requirement, or None."""
+        fd, report_path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            if self._pip("install", "--dry-run", "--ignore-installed", "--report", report_path,
+                         *self._local_args(), requirement, quiet=True) != 0:
+                return None
+            with open(report_path, "r", encoding="utf-8") as f:
+                report = json.load(f)
+            return sorted(os.path.basename(unquote(urlparse(item["download_info"]["url"]).path))
+                          for item in report.get("install", []))
+        except (OSError, ValueError, KeyError):
+            return None
+        finally:
+            os.remove(report_path)
+
+    def _save_manifest(self, manifest):
+        path = os.path.join(self.path, MANIFEST_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def _pip(self, *args, quiet=False):
+        command = [self.python, "-m", "pip", *args, "--disable-pip-version-check"]
+        if quiet:
+            return subprocess.call(command + ["--quiet"], stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL)
+        return subprocess.call(command, stdout=self.output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the local wheelhouse used by AutoInstaller.")
+    parser.add_argument("command", choices=["prewarm", "install", "list"])
+    parser.add_argument("args", nargs="*", help="A requirements file for prewarm, package names for install")
+    parser.add_argument("--wheelhouse", default=WHEELHOUSE_DIR)
+    parser.add_argument("--index", default=None, help="Index URL or local wheel directory to fetch from")
+    args = parser.parse_args(argv)
+
+    wheelhouse = Wheelhouse(args.wheelhouse, index=args.index)
+    if args.command == "list":
+        for requirement, entry in sorted(wheelhouse.manifest().items()):
+            print(f"{requirement}: {', '.join(entry.get('wheels') or ['?'])}")
+        return 0
+    if args.command == "prewarm":
+        return 0 if all(wheelhouse.prewarm(f) for f in args.args) else 1
+    return 0 if wheelhouse.install(args.args) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())